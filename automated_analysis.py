@@ -32,6 +32,9 @@ Scheduling Examples:
 
 import argparse
 import logging
+import os
+from collections import defaultdict
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import json
@@ -40,13 +43,23 @@ from pathlib import Path
 # Import our modules
 from tradingview_screener import (
     fetch_screener_indicators,
-    map_to_trading_metrics_format,
-    validate_indicator_data
+    map_to_trading_metrics_format
+)
+from trading_metrics import (
+    INDICATOR_KEYS,
+    compute_metrics_batch,
+    expand_metrics_batch,
+    indicators_to_array
 )
-from trading_metrics import compute_metrics
 from trading_utils import get_full_analysis, setup_logging
-from trading_constants import Signal
+from trading_constants import SignalLevel
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to stdlib json
+    orjson = None
 
+logger = logging.getLogger(__name__)
 
 # Configuration
 DEFAULT_SYMBOLS = [
@@ -63,11 +76,27 @@ DEFAULT_SYMBOLS = [
 DEFAULT_EXCHANGE = 'BINANCE'
 DEFAULT_TIMEFRAME = '1h'
 OUTPUT_DIR = Path('analysis_reports')
-ALERT_SIGNALS = [Signal.STRONG_BUY, Signal.STRONG_SELL]
+ALERT_SIGNALS = (SignalLevel.STRONG_BUY, SignalLevel.STRONG_SELL)
+
+# Report separator lines
+SEP = '=' * 80 + '\n'
+DASH = '-' * 80 + '\n'
+
+# Order in which signal groups appear in reports
+_SIGNAL_DISPLAY_ORDER = tuple(sorted(SignalLevel, reverse=True))
 
+# Directories already created by _ensure_dir during this process
+_ensured_dirs: set[Path] = set()
 
+
+@lru_cache(maxsize=1)
 def setup_argparse() -> argparse.ArgumentParser:
-    """Setup command-line argument parser"""
+    """
+    Setup command-line argument parser
+
+    The parser holds no per-run state, so it is built once and reused when
+    main() is invoked repeatedly in-process.
+    """
     parser = argparse.ArgumentParser(
         description='Automated Cryptocurrency Trading Analysis',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -121,6 +150,18 @@ def setup_argparse() -> argparse.ArgumentParser:
         help='Also output results in JSON format'
     )
 
+    parser.add_argument(
+        '--no-text',
+        action='store_true',
+        help='Skip the text report (use with --json/--parquet for unattended runs)'
+    )
+
+    parser.add_argument(
+        '--parquet',
+        action='store_true',
+        help='Also output results as a Parquet file (requires pyarrow or fastparquet)'
+    )
+
     parser.add_argument(
         '--quiet',
         action='store_true',
@@ -138,6 +179,34 @@ def setup_argparse() -> argparse.ArgumentParser:
     return parser
 
 
+def _ensure_dir(path: Path) -> None:
+    """Create a directory (and parents) once per process"""
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """
+    Write data as indented JSON, using orjson when available
+
+    The file is written to a temporary sibling and moved into place with
+    os.replace, so readers (e.g. the alert notifier) never see a partial file.
+
+    Args:
+        path: Destination file
+        data: JSON-serializable data
+    """
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    if orjson is not None:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
 def filter_by_signal(
     results: Dict[str, Dict[str, Any]],
     min_signal: Optional[str]
@@ -155,32 +224,44 @@ def filter_by_signal(
     if not min_signal:
         return results
 
-    signal_order = {
-        'STRONG_SELL': 0,
-        'SELL': 1,
-        'NEUTRAL': 2,
-        'BUY': 3,
-        'STRONG_BUY': 4
-    }
-
-    min_level = signal_order[min_signal]
+    min_level = SignalLevel[min_signal]
     filtered = {}
 
     for symbol, data in results.items():
-        signal = data['composite_signal']
-        if signal_order[signal] >= min_level:
+        if data['signal_level'] >= min_level:
             filtered[symbol] = data
 
     return filtered
 
 
+def group_by_signal(
+    results: Dict[str, Dict[str, Any]]
+) -> Dict[SignalLevel, List[tuple[str, Dict[str, Any]]]]:
+    """
+    Group results by composite signal
+
+    Args:
+        results: Analysis results
+
+    Returns:
+        Mapping of SignalLevel to list of (symbol, data) tuples
+    """
+    by_signal = defaultdict(list)
+    for symbol, data in results.items():
+        by_signal[data['signal_level']].append((symbol, data))
+    return by_signal
+
+
 def save_report(
     results: Dict[str, Dict[str, Any]],
     output_dir: Path,
     timeframe: str,
     exchange: str,
-    as_json: bool = False
-) -> tuple[str, Optional[str]]:
+    as_json: bool = False,
+    now: Optional[datetime] = None,
+    by_signal: Optional[Dict[SignalLevel, List[tuple[str, Dict[str, Any]]]]] = None,
+    skip_text: bool = False
+) -> tuple[Optional[str], Optional[str]]:
     """
     Save analysis report to file
 
@@ -190,57 +271,55 @@ def save_report(
         timeframe: Analysis timeframe
         exchange: Exchange name
         as_json: Also save as JSON
+        now: Run timestamp (default: current time)
+        by_signal: Precomputed group_by_signal(results)
+        skip_text: Do not write the human-readable text report
 
     Returns:
-        Tuple of (text_report_path, json_report_path)
+        Tuple of (text_report_path, json_report_path); either may be None
     """
+    now = now or datetime.now()
+    if by_signal is None:
+        by_signal = group_by_signal(results)
+
     # Create output directory if it doesn't exist
-    output_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(output_dir)
 
-    timestamp = datetime.now().strftime('%Y-%m-%d-%H-%M')
+    timestamp = now.strftime('%Y-%m-%d-%H-%M')
     base_name = f'automated-analysis-{timestamp}'
 
-    # Save text report
-    txt_path = output_dir / f'{base_name}.txt'
-    with open(txt_path, 'w', encoding='utf-8') as f:
-        f.write("AUTOMATED CRYPTOCURRENCY TRADING ANALYSIS\n")
-        f.write("=" * 80 + "\n\n")
-        f.write(f"Analysis Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"Timeframe: {timeframe}\n")
-        f.write(f"Exchange: {exchange}\n")
-        f.write(f"Symbols Analyzed: {len(results)}\n\n")
-
-        # Group by signal
-        by_signal = {}
-        for symbol, data in results.items():
-            signal = data['composite_signal']
-            if signal not in by_signal:
-                by_signal[signal] = []
-            by_signal[signal].append((symbol, data))
-
-        # Write summary
-        f.write("SUMMARY\n")
-        f.write("-" * 80 + "\n\n")
-        signal_order = ['STRONG_BUY', 'BUY', 'NEUTRAL', 'SELL', 'STRONG_SELL']
-        for signal in signal_order:
-            if signal in by_signal:
-                f.write(f"{signal}: {len(by_signal[signal])} symbols\n")
-
-        # Write detailed results
-        f.write("\n\nDETAILED ANALYSIS\n")
-        f.write("=" * 80 + "\n\n")
-
-        for signal in signal_order:
-            if signal in by_signal:
-                f.write(f"\n{signal} SIGNALS ({len(by_signal[signal])} symbols)\n")
-                f.write("-" * 80 + "\n\n")
-
-                for symbol, data in by_signal[signal]:
-                    f.write(f"\n{'='*80}\n")
-                    f.write(f"{symbol}\n")
-                    f.write(f"{'='*80}\n")
-                    f.write(data['analysis'])
-                    f.write(f"\n{'='*80}\n\n")
+    # Save text report unless only machine-readable output was requested
+    txt_path = None
+    if not skip_text:
+        txt_path = output_dir / f'{base_name}.txt'
+        parts = [
+            "AUTOMATED CRYPTOCURRENCY TRADING ANALYSIS\n",
+            f"{SEP}\n",
+            f"Analysis Time: {now.strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"Timeframe: {timeframe}\n",
+            f"Exchange: {exchange}\n",
+            f"Symbols Analyzed: {len(results)}\n\n",
+        ]
+
+        # Summary and detailed sections are filled in one pass over the groups
+        summary = [f"SUMMARY\n{DASH}\n"]
+        details = [f"\n\nDETAILED ANALYSIS\n{SEP}\n"]
+        for signal in _SIGNAL_DISPLAY_ORDER:
+            group = by_signal.get(signal)
+            if not group:
+                continue
+            summary.append(f"{signal.name}: {len(group)} symbols\n")
+            details.append(f"\n{signal.name} SIGNALS ({len(group)} symbols)\n{DASH}\n")
+            details.extend(
+                f"\n{SEP}{symbol}\n{SEP}{data['analysis']}\n{SEP}\n"
+                for symbol, data in group
+            )
+
+        parts.extend(summary)
+        parts.extend(details)
+
+        with open(txt_path, 'w', encoding='utf-8') as f:
+            f.write(''.join(parts))
 
     # Save JSON report if requested
     json_path = None
@@ -249,7 +328,7 @@ def save_report(
 
         # Prepare JSON-serializable data
         json_data = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'timeframe': timeframe,
             'exchange': exchange,
             'symbols_analyzed': len(results),
@@ -261,21 +340,82 @@ def save_report(
                 'signal': data['composite_signal'],
                 'recommendation': data['recommendation'],
                 'metrics': data['metrics'],
-                'indicators': {
-                    k: float(v) if isinstance(v, (int, float)) else v
-                    for k, v in data['indicators'].items()
-                }
+                'indicators': data['indicators']
             }
 
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, indent=2)
+        _write_json(json_path, json_data)
+
+    return str(txt_path) if txt_path else None, str(json_path) if json_path else None
+
+
+def save_parquet(
+    results: Dict[str, Dict[str, Any]],
+    output_dir: Path,
+    now: Optional[datetime] = None
+) -> Optional[str]:
+    """
+    Save results as a columnar Parquet file for downstream batch readers
+
+    One row per symbol: signal columns are dictionary-encoded and indicator
+    values are stored as float32. Requires pandas plus pyarrow or fastparquet.
+
+    Args:
+        results: Analysis results
+        output_dir: Output directory
+        now: Run timestamp (default: current time)
+
+    Returns:
+        Path to the Parquet file or None if it could not be written
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        logger.error("pandas is required for --parquet output")
+        return None
+
+    now = now or datetime.now()
+    _ensure_dir(output_dir)
+    parquet_path = output_dir / f"automated-analysis-{now.strftime('%Y-%m-%d-%H-%M')}.parquet"
+
+    rows = []
+    for symbol, data in results.items():
+        metrics = data['metrics']
+        composite = metrics['composite']
+        row = {
+            'symbol': symbol,
+            'signal': data['composite_signal'],
+            'recommendation': data['recommendation'],
+            'price': metrics['price'],
+            'change': metrics['change'],
+            'rating': composite['rating'],
+            'raw_score': composite['breakdown']['raw_score'],
+            'trend_strength': composite['trend_strength'],
+        }
+        for name, indicator in metrics['indicators'].items():
+            row[f'{name}_rating'] = indicator['rating']
+        row.update(data['indicators'])
+        rows.append(row)
+
+    df = pd.DataFrame(rows)
+    if not df.empty:
+        df['signal'] = df['signal'].astype('category')
+        indicator_cols = [c for c in INDICATOR_KEYS if c in df.columns]
+        df[indicator_cols] = df[indicator_cols].astype('float32')
 
-    return str(txt_path), str(json_path) if json_path else None
+    try:
+        df.to_parquet(parquet_path, index=False)
+    except ImportError as e:
+        logger.error("Parquet output needs pyarrow or fastparquet: %s", e)
+        return None
+
+    return str(parquet_path)
 
 
 def create_notification_file(
     results: Dict[str, Dict[str, Any]],
-    output_dir: Path
+    output_dir: Path,
+    now: Optional[datetime] = None,
+    by_signal: Optional[Dict[SignalLevel, List[tuple[str, Dict[str, Any]]]]] = None
 ) -> Optional[str]:
     """
     Create notification file for strong signals
@@ -286,34 +426,116 @@ def create_notification_file(
     Args:
         results: Analysis results
         output_dir: Output directory
+        now: Run timestamp (default: current time)
+        by_signal: Precomputed group_by_signal(results)
 
     Returns:
         Path to notification file or None
     """
-    # Filter for strong signals
+    ts_iso = (now or datetime.now()).isoformat()
+    if by_signal is None:
+        by_signal = group_by_signal(results)
+
+    # Collect strong signals
     alerts = {}
-    for symbol, data in results.items():
-        signal = data['composite_signal']
-        if signal in ['STRONG_BUY', 'STRONG_SELL']:
-            alerts[symbol] = {
-                'signal': signal,
-                'recommendation': data['recommendation'],
-                'timestamp': datetime.now().isoformat()
-            }
+    for symbol, data in (item for level in ALERT_SIGNALS for item in by_signal.get(level, ())):
+        alerts[symbol] = {
+            'signal': data['composite_signal'],
+            'recommendation': data['recommendation'],
+            'timestamp': ts_iso
+        }
 
     if not alerts:
         return None
 
     # Create notification file
-    output_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(output_dir)
     notify_path = output_dir / 'ALERTS.json'
 
-    with open(notify_path, 'w', encoding='utf-8') as f:
-        json.dump(alerts, f, indent=2)
+    _write_json(notify_path, alerts)
 
     return str(notify_path)
 
 
+def _log_symbol_error(symbol: str, error: Exception) -> None:
+    """Log a per-symbol failure, with traceback only when debugging"""
+    logger.error(
+        "%s: Analysis error: %s", symbol, error,
+        exc_info=logger.isEnabledFor(logging.DEBUG)
+    )
+
+
+def _prepare_one(data: Dict[str, Any]) -> Optional[tuple[str, Dict[str, Any]]]:
+    """
+    Convert a single screener row to trading metrics format
+
+    Indicator validation happens later, for all rows at once, in
+    compute_metrics_batch.
+
+    Args:
+        data: Screener row as returned by fetch_screener_indicators
+
+    Returns:
+        Tuple of (symbol, indicators) or None if the symbol was skipped
+    """
+    symbol = data.get('symbol', 'UNKNOWN')
+
+    try:
+        indicators = map_to_trading_metrics_format(data)
+        if indicators is None:
+            logger.warning("%s: Missing required indicators", symbol)
+            return None
+
+        return symbol, indicators
+
+    except Exception as e:
+        _log_symbol_error(symbol, e)
+        return None
+
+
+def _analyze_one(
+    prepared: tuple[str, Dict[str, Any]],
+    metrics: Optional[Dict[str, Any]]
+) -> Optional[tuple[str, Dict[str, Any]]]:
+    """
+    Build the analysis for a single scored symbol
+
+    Errors are logged here rather than raised, so one bad symbol doesn't
+    abort the run.
+
+    Args:
+        prepared: Tuple of (symbol, indicators)
+        metrics: Metrics for this symbol from the batch scoring step
+
+    Returns:
+        Tuple of (symbol, result) or None if the symbol was skipped
+    """
+    symbol, indicators = prepared
+    if not metrics:
+        return None
+
+    try:
+        # Get analysis
+        analysis = get_full_analysis(indicators, metrics, symbol)
+
+        logger.info("%s: %s", symbol, metrics['composite_signal'])
+
+        result = {
+            'indicators': indicators,
+            'metrics': metrics,
+            'analysis': analysis,
+            'composite_signal': metrics['composite_signal'],
+            'signal_level': SignalLevel[metrics['composite_signal']],
+            'recommendation': analysis.partition('\n')[0]
+        }
+
+        return symbol, result
+
+    except Exception as e:
+        _log_symbol_error(symbol, e)
+        return None
+
+
 def main():
     """Main execution function"""
     # Parse arguments
@@ -326,7 +548,6 @@ def main():
         log_file='automated_analysis.log',
         console_level=log_level
     )
-    logger = logging.getLogger(__name__)
 
     logger.info("="*80)
     logger.info("AUTOMATED TRADING ANALYSIS STARTED")
@@ -356,38 +577,29 @@ def main():
 
         logger.info(f"Fetched data for {len(screener_data)} symbols")
 
-        # Analyze each symbol
+        # Convert each symbol to trading metrics format
         results = {}
-        for data in screener_data:
-            symbol = data.get('symbol', 'UNKNOWN')
-
-            try:
-                # Convert and validate
-                indicators = map_to_trading_metrics_format(data)
-                if not validate_indicator_data(indicators, symbol):
-                    continue
-
-                # Compute metrics
-                metrics = compute_metrics(indicators)
-                if not metrics:
-                    continue
-
-                # Get analysis
-                analysis = get_full_analysis(indicators, metrics, symbol)
-
-                results[symbol] = {
-                    'indicators': indicators,
-                    'metrics': metrics,
-                    'analysis': analysis,
-                    'composite_signal': metrics['composite_signal'],
-                    'recommendation': analysis.split('\n')[0]
-                }
-
-                logger.info(f"{symbol}: {metrics['composite_signal']}")
-
-            except Exception as e:
-                logger.error(f"{symbol}: Analysis error: {e}", exc_info=True)
-                continue
+        pending = [prepared for prepared in map(_prepare_one, screener_data) if prepared is not None]
+
+        # Raw screener rows are no longer needed; release them before scoring
+        del screener_data
+
+        if pending:
+            # Score all remaining symbols in one vectorized call
+            X = indicators_to_array(indicators for _, indicators in pending)
+            batch = compute_metrics_batch(X)
+            metrics_list = expand_metrics_batch(X, batch)
+
+            invalid = [symbol for (symbol, _), ok in zip(pending, batch['valid']) if not ok]
+            if invalid:
+                logger.warning("Skipped %d symbols with invalid indicator data: %s",
+                               len(invalid), ', '.join(invalid))
+
+            # Build per-symbol analyses
+            for item in map(_analyze_one, pending, metrics_list):
+                if item is not None:
+                    symbol, result = item
+                    results[symbol] = result
 
         # Filter by minimum signal if specified
         if args.min_signal:
@@ -395,23 +607,38 @@ def main():
             results = filter_by_signal(results, args.min_signal)
             logger.info(f"Filtered: {original_count} → {len(results)} symbols (min: {args.min_signal})")
 
+        by_signal = group_by_signal(results)
+
         # Save reports
+        run_ts = datetime.now()
         output_dir = Path(args.output_dir)
         txt_path, json_path = save_report(
             results,
             output_dir,
             args.timeframe,
             args.exchange,
-            as_json=args.json
+            as_json=args.json,
+            now=run_ts,
+            by_signal=by_signal,
+            skip_text=args.no_text
         )
 
-        logger.info(f"✅ Text report saved: {txt_path}")
+        if txt_path:
+            logger.info(f"✅ Text report saved: {txt_path}")
         if json_path:
             logger.info(f"✅ JSON report saved: {json_path}")
 
+        parquet_path = None
+        if args.parquet:
+            parquet_path = save_parquet(results, output_dir, now=run_ts)
+            if parquet_path:
+                logger.info(f"✅ Parquet report saved: {parquet_path}")
+
         # Create notification file if requested
         if args.notify:
-            notify_path = create_notification_file(results, output_dir)
+            notify_path = create_notification_file(
+                results, output_dir, now=run_ts, by_signal=by_signal
+            )
             if notify_path:
                 logger.info(f"🔔 Alerts file created: {notify_path}")
             else:
@@ -423,20 +650,17 @@ def main():
             print("ANALYSIS COMPLETE")
             print("="*80)
             print(f"\nAnalyzed: {len(results)} symbols")
-            print(f"Report: {txt_path}")
+            if txt_path:
+                print(f"Report: {txt_path}")
             if json_path:
                 print(f"JSON: {json_path}")
-
-            # Quick summary
-            by_signal = {}
-            for data in results.values():
-                signal = data['composite_signal']
-                by_signal[signal] = by_signal.get(signal, 0) + 1
+            if parquet_path:
+                print(f"Parquet: {parquet_path}")
 
             print("\nSignal Distribution:")
-            for signal in ['STRONG_BUY', 'BUY', 'NEUTRAL', 'SELL', 'STRONG_SELL']:
+            for signal in _SIGNAL_DISPLAY_ORDER:
                 if signal in by_signal:
-                    print(f"  {signal:15s}: {by_signal[signal]} symbols")
+                    print(f"  {signal.name:15s}: {len(by_signal[signal])} symbols")
 
             print("\n" + "="*80 + "\n")
 
@@ -8,13 +8,22 @@ NO USER INPUT REQUIRED - Runs completely automatically
 Optimized for Nairobi/Kenya timezone (EAT - UTC+3)
 """
 
+import io
 import sys
 import os
 import json
+import time
+import numpy as np
+import pandas as pd
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from datetime import datetime
+from enum import IntEnum
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import logging
 
 # Setup logging
@@ -42,6 +51,18 @@ except ImportError:
     HAS_TRADINGVIEW = False
     logger.warning("tradingview-screener not available - using Binance data only")
 
+# orjson is optional; falls back to stdlib json for parsing responses
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Redis is optional; without it responses are cached in-process only
+try:
+    import redis
+except ImportError:
+    redis = None
+
 # Try to import pytz, fall back to manual offset
 try:
     import pytz
@@ -69,6 +90,32 @@ BINANCE_API_BASE = "https://api.binance.com/api/v3"
 # Default USD to KES rate
 DEFAULT_USD_TO_KES = 129.50
 
+# Response cache TTLs (seconds)
+FX_CACHE_TTL = 3600
+STATS_CACHE_TTL = 30
+
+# Redis server for the shared response cache
+REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+
+# Last successful 24h stats, served when Binance is unreachable
+LAST_STATS_FILE = Path(__file__).parent / "logs" / "last_stats.json"
+
+class Confidence(IntEnum):
+    """Opportunity confidence rank (lower sorts first)"""
+    HIGH = 0
+    MEDIUM_HIGH = 1
+    MEDIUM = 2
+    MEDIUM_LOW = 3
+    LOW = 4
+
+    @property
+    def label(self) -> str:
+        """Display name, e.g. MEDIUM-HIGH"""
+        return self.name.replace('_', '-')
+
+# Display names indexed by Confidence rank, for rendering whole columns at once
+CONFIDENCE_NAMES = np.array([c.label for c in Confidence])
+
 # TradingView indicators to fetch
 TV_INDICATORS = [
     'close', 'open', 'high', 'low', 'volume',
@@ -81,62 +128,177 @@ TV_INDICATORS = [
     'Recommend.All', 'Recommend.MA', 'Recommend.Other'
 ]
 
+# Shared HTTP session so every request reuses keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# ==================== RESPONSE CACHE ====================
+
+_redis_client = None
+_redis_checked = False
+_local_cache: Dict[str, tuple] = {}
+
+def _get_redis():
+    """Get the Redis client, or None if Redis is not installed or reachable"""
+    global _redis_client, _redis_checked
+    if not _redis_checked:
+        _redis_checked = True
+        if redis is not None:
+            try:
+                client = redis.Redis.from_url(REDIS_URL, socket_timeout=0.5)
+                client.ping()
+                _redis_client = client
+            except Exception as e:
+                logger.info("Redis unavailable, using in-process cache: %s", e)
+    return _redis_client
+
+def cache_get(key: str) -> Any:
+    """Return the cached value for key, or None if missing or expired"""
+    client = _get_redis()
+    if client is not None:
+        try:
+            raw = client.get(key)
+            return json.loads(raw) if raw is not None else None
+        except Exception as e:
+            logger.warning("Redis read failed for %s: %s", key, e)
+    entry = _local_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+def cache_set(key: str, value: Any, ttl: int) -> None:
+    """Cache a JSON-serializable value for ttl seconds"""
+    client = _get_redis()
+    if client is not None:
+        try:
+            client.setex(key, ttl, json.dumps(value))
+            return
+        except Exception as e:
+            logger.warning("Redis write failed for %s: %s", key, e)
+    _local_cache[key] = (time.monotonic() + ttl, value)
+
+def save_last_stats(stats: Dict[str, Dict]) -> None:
+    """Persist the last good 24h stats atomically"""
+    try:
+        LAST_STATS_FILE.parent.mkdir(exist_ok=True)
+        tmp = LAST_STATS_FILE.with_suffix('.json.tmp')
+        tmp.write_text(json.dumps(stats), encoding='utf-8')
+        os.replace(tmp, LAST_STATS_FILE)
+    except OSError as e:
+        logger.warning("Failed to save last stats: %s", e)
+
+def load_last_stats(symbols: List[str]) -> Dict[str, Dict]:
+    """Load the last good 24h stats, marked as stale"""
+    try:
+        saved = json.loads(LAST_STATS_FILE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    return {
+        symbol: {**saved[symbol], 'stale': True}
+        for symbol in symbols if symbol in saved
+    }
+
 # ==================== API FUNCTIONS ====================
 
 def get_usd_to_kes_rate() -> float:
     """Get current USD to KES exchange rate"""
+    cache_key = 'majors:fx:USD:KES'
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        response = requests.get(
+        response = _SESSION.get(
             "https://api.exchangerate-api.com/v4/latest/USD",
             timeout=5
         )
         if response.status_code == 200:
-            data = response.json()
-            return data.get('rates', {}).get('KES', DEFAULT_USD_TO_KES)
+            data = _parse_json(response)
+            rate = data.get('rates', {}).get('KES')
+            if rate is not None:
+                cache_set(cache_key, rate, FX_CACHE_TTL)
+                return rate
     except Exception as e:
-        logger.warning(f"Failed to get exchange rate: {e}")
+        logger.warning("Failed to get exchange rate: %s", e)
     return DEFAULT_USD_TO_KES
 
+def _parse_json(response: requests.Response) -> Any:
+    """Parse a JSON response body, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def _symbols_param(symbols: List[str]) -> Dict[str, str]:
+    """Build the `symbols` query parameter so Binance only returns requested rows"""
+    return {'symbols': json.dumps(list(symbols), separators=(',', ':'))}
+
+def _fetch_tickers(endpoint: str, symbols: List[str], timeout: int) -> List[Dict]:
+    """
+    Fetch ticker rows for symbols from a Binance ticker endpoint
+
+    Binance rejects the whole symbols=[...] request when any symbol is unknown
+    (e.g. delisted), so on HTTP 400 fall back to the full-market response and
+    keep only the wanted symbols.
+    """
+    url = f"{BINANCE_API_BASE}/{endpoint}"
+    response = _SESSION.get(url, params=_symbols_param(symbols), timeout=timeout)
+    if response.status_code != 400:
+        response.raise_for_status()
+        return _parse_json(response)
+
+    logger.warning("Binance rejected symbols filter on %s, fetching full market", endpoint)
+    response = _SESSION.get(url, timeout=timeout)
+    response.raise_for_status()
+    wanted = frozenset(symbols)
+    return [item for item in _parse_json(response) if item['symbol'] in wanted]
+
 def get_binance_prices(symbols: List[str]) -> Dict[str, float]:
     """Fetch current prices from Binance"""
     prices = {}
     try:
-        response = requests.get(f"{BINANCE_API_BASE}/ticker/price", timeout=10)
-        response.raise_for_status()
-        all_prices = response.json()
-        price_lookup = {item['symbol']: float(item['price']) for item in all_prices}
-
-        for symbol in symbols:
-            if symbol in price_lookup:
-                prices[symbol] = price_lookup[symbol]
+        prices = {item['symbol']: float(item['price']) for item in _fetch_tickers('ticker/price', symbols, 10)}
     except Exception as e:
-        logger.error(f"Failed to fetch Binance prices: {e}")
+        logger.error("Failed to fetch Binance prices: %s", e)
     return prices
 
 def get_binance_24h_stats(symbols: List[str]) -> Dict[str, Dict]:
     """Fetch 24h statistics from Binance"""
+    cache_key = f"majors:ticker24hr:{','.join(symbols)}"
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return cached
+
     stats = {}
     try:
-        response = requests.get(f"{BINANCE_API_BASE}/ticker/24hr", timeout=15)
-        response.raise_for_status()
-        all_stats = response.json()
-        stats_lookup = {item['symbol']: item for item in all_stats}
-
-        for symbol in symbols:
-            if symbol in stats_lookup:
-                item = stats_lookup[symbol]
-                stats[symbol] = {
-                    'price': float(item['lastPrice']),
-                    'change_24h': float(item['priceChangePercent']),
-                    'high_24h': float(item['highPrice']),
-                    'low_24h': float(item['lowPrice']),
-                    'volume_24h': float(item['volume']),
-                    'quote_volume_24h': float(item['quoteVolume'])
-                }
+        stats = {
+            item['symbol']: {
+                'price': float(item['lastPrice']),
+                'change_24h': float(item['priceChangePercent']),
+                'high_24h': float(item['highPrice']),
+                'low_24h': float(item['lowPrice']),
+                'volume_24h': float(item['volume']),
+                'quote_volume_24h': float(item['quoteVolume'])
+            }
+            for item in _fetch_tickers('ticker/24hr', symbols, 15)
+        }
+        cache_set(cache_key, stats, STATS_CACHE_TTL)
+        save_last_stats(stats)
     except Exception as e:
-        logger.error(f"Failed to fetch Binance 24h stats: {e}")
+        logger.error("Failed to fetch Binance 24h stats: %s", e)
+        stats = load_last_stats(symbols)
+        if stats:
+            logger.warning("Using stale 24h stats for %d symbols from %s", len(stats), LAST_STATS_FILE)
     return stats
 
+# TradingView timeframe codes
+TV_TIMEFRAMES = {'1h': '60', '4h': '240', '1d': '1D', '1w': '1W'}
+
+@lru_cache(maxsize=None)
+def _tv_columns(tv_tf: str) -> Tuple[Tuple[str, ...], Dict[str, str]]:
+    """Suffixed TradingView column names for a timeframe, and their mapping back to TV_INDICATORS"""
+    columns = tuple(f"{ind}|{tv_tf}" for ind in TV_INDICATORS)
+    return columns, dict(zip(columns, TV_INDICATORS))
+
 def get_tradingview_indicators(symbols: List[str], timeframe: str = '1h') -> Dict[str, Dict]:
     """Fetch technical indicators from TradingView"""
     if not HAS_TRADINGVIEW:
@@ -145,16 +307,13 @@ def get_tradingview_indicators(symbols: List[str], timeframe: str = '1h') -> Dic
     indicators = {}
 
     # Map timeframe to TradingView format
-    tf_map = {'1h': '60', '4h': '240', '1d': '1D', '1w': '1W'}
-    tv_tf = tf_map.get(timeframe, '60')
+    tv_tf = TV_TIMEFRAMES.get(timeframe, '60')
+    columns, column_names = _tv_columns(tv_tf)
 
     try:
         # Build tickers list
         tickers = [f"BINANCE:{symbol}" for symbol in symbols]
 
-        # Build columns with timeframe suffix
-        columns = [f"{ind}|{tv_tf}" for ind in TV_INDICATORS]
-
         # Create query
         query = Query().set_markets('crypto').select(*columns).set_tickers(*tickers)
 
@@ -162,186 +321,310 @@ def get_tradingview_indicators(symbols: List[str], timeframe: str = '1h') -> Dic
         count, df = query.get_scanner_data()
 
         if df is not None and not df.empty:
-            for _, row in df.iterrows():
-                ticker = row.get('ticker', '')
-                symbol = ticker.replace('BINANCE:', '')
-
-                if symbol in symbols:
-                    indicators[symbol] = {}
-                    for ind in TV_INDICATORS:
-                        col_name = f"{ind}|{tv_tf}"
-                        indicators[symbol][ind] = row.get(col_name)
+            # Strip the timeframe suffix and key rows by Binance symbol
+            df = df.rename(columns=column_names)
+            df['symbol'] = df['ticker'].str.replace('BINANCE:', '', regex=False)
+            df = df[df['symbol'].isin(symbols)].drop_duplicates('symbol', keep='last')
+            indicators = df.set_index('symbol').reindex(columns=TV_INDICATORS).to_dict(orient='index')
 
     except Exception as e:
-        logger.error(f"Failed to fetch TradingView indicators: {e}")
+        logger.error("Failed to fetch TradingView indicators: %s", e)
 
     return indicators
 
 # ==================== ANALYSIS FUNCTIONS ====================
 
-def get_signal_from_recommendation(rec_value: float) -> str:
-    """Convert TradingView recommendation value to signal"""
-    if rec_value is None:
-        return "NEUTRAL"
-    if rec_value >= 0.5:
-        return "STRONG_BUY"
-    elif rec_value >= 0.1:
-        return "BUY"
-    elif rec_value <= -0.5:
-        return "STRONG_SELL"
-    elif rec_value <= -0.1:
-        return "SELL"
-    return "NEUTRAL"
-
-def get_rsi_signal(rsi: float) -> str:
-    """Analyze RSI value"""
-    if rsi is None:
-        return "NEUTRAL"
-    if rsi > 70:
-        return "OVERBOUGHT"
-    elif rsi < 30:
-        return "OVERSOLD"
-    elif rsi > 60:
-        return "BULLISH"
-    elif rsi < 40:
-        return "BEARISH"
-    return "NEUTRAL"
-
-def analyze_coin(symbol: str, stats: Dict, tv_data: Dict, usd_to_kes: float) -> Dict:
-    """Analyze a single coin"""
-    analysis = {
-        'symbol': symbol,
-        'price_usd': stats.get('price', 0),
-        'price_kes': stats.get('price', 0) * usd_to_kes,
-        'change_24h': stats.get('change_24h', 0),
-        'volume_24h_usd': stats.get('quote_volume_24h', 0),
-        'high_24h': stats.get('high_24h', 0),
-        'low_24h': stats.get('low_24h', 0),
-    }
+def recommendation_signals(values) -> np.ndarray:
+    """Map TradingView recommendation values to signals; missing values are NEUTRAL"""
+    v = np.asarray(values, dtype=float)
+    return np.select(
+        [v >= 0.5, v >= 0.1, v <= -0.5, v <= -0.1],
+        ["STRONG_BUY", "BUY", "STRONG_SELL", "SELL"],
+        default="NEUTRAL"
+    )
+
+def rsi_signals(values) -> np.ndarray:
+    """Map RSI values to signals; missing values are NEUTRAL"""
+    v = np.asarray(values, dtype=float)
+    return np.select(
+        [v > 70, v < 30, v > 60, v < 40],
+        ["OVERBOUGHT", "OVERSOLD", "BULLISH", "BEARISH"],
+        default="NEUTRAL"
+    )
+
+def _column(df: pd.DataFrame, name: str, default: Any) -> pd.Series:
+    """Column of df with missing values (or a missing column) set to default"""
+    if name not in df:
+        return pd.Series(default, index=df.index)
+    return df[name].fillna(default)
+
+def _to_records(df: pd.DataFrame) -> List[Dict]:
+    """Convert a DataFrame to plain dicts, with None for missing values"""
+    return df.astype(object).where(df.notna(), None).to_dict(orient='records')
+
+# Analysis keys derived from TradingView data, as (analysis key, TV indicator)
+TV_ANALYSIS_FIELDS = [
+    ('rsi', 'RSI'),
+    ('macd', 'MACD.macd'),
+    ('macd_signal', 'MACD.signal'),
+    ('ema20', 'EMA20'),
+    ('ema50', 'EMA50'),
+    ('ema200', 'EMA200'),
+    ('bb_upper', 'BB.upper'),
+    ('bb_lower', 'BB.lower'),
+    ('adx', 'ADX'),
+    ('cci', 'CCI20'),
+]
 
-    # Add TradingView indicators if available
-    if tv_data:
-        analysis['rsi'] = tv_data.get('RSI')
-        analysis['rsi_signal'] = get_rsi_signal(tv_data.get('RSI'))
-        analysis['macd'] = tv_data.get('MACD.macd')
-        analysis['macd_signal'] = tv_data.get('MACD.signal')
-        analysis['ema20'] = tv_data.get('EMA20')
-        analysis['ema50'] = tv_data.get('EMA50')
-        analysis['ema200'] = tv_data.get('EMA200')
-        analysis['bb_upper'] = tv_data.get('BB.upper')
-        analysis['bb_lower'] = tv_data.get('BB.lower')
-        analysis['adx'] = tv_data.get('ADX')
-        analysis['cci'] = tv_data.get('CCI20')
-
-        # Overall signals
-        rec_all = tv_data.get('Recommend.All')
-        rec_ma = tv_data.get('Recommend.MA')
-        rec_other = tv_data.get('Recommend.Other')
-
-        analysis['signal_overall'] = get_signal_from_recommendation(rec_all)
-        analysis['signal_ma'] = get_signal_from_recommendation(rec_ma)
-        analysis['signal_oscillators'] = get_signal_from_recommendation(rec_other)
-
-        # Trend analysis
-        price = stats.get('price', 0)
-        ema20 = tv_data.get('EMA20')
-        ema50 = tv_data.get('EMA50')
-        ema200 = tv_data.get('EMA200')
-
-        if price and ema20 and ema50:
-            if price > ema20 > ema50:
-                analysis['trend'] = "UPTREND"
-            elif price < ema20 < ema50:
-                analysis['trend'] = "DOWNTREND"
-            else:
-                analysis['trend'] = "SIDEWAYS"
-        else:
-            analysis['trend'] = "UNKNOWN"
-    else:
-        # Default values if no TV data
-        analysis['signal_overall'] = "NEUTRAL"
-        analysis['signal_ma'] = "NEUTRAL"
-        analysis['signal_oscillators'] = "NEUTRAL"
-        analysis['trend'] = "UNKNOWN"
+# Keys only present in an analysis when TradingView data was available
+TV_ONLY_KEYS = ('rsi', 'rsi_signal', 'macd', 'macd_signal', 'ema20', 'ema50',
+                'ema200', 'bb_upper', 'bb_lower', 'adx', 'cci')
 
-    return analysis
+def analyze_coins(
+    binance_stats: Dict[str, Dict],
+    tv_indicators: Dict[str, Dict],
+    usd_to_kes: float,
+    symbols: Optional[List[str]] = None
+) -> List[Dict]:
+    """Analyze all coins with Binance stats in one vectorized pass, in symbols order"""
+    symbols = [s for s in (symbols or binance_stats) if s in binance_stats]
+    if not symbols:
+        return []
+
+    stats = pd.DataFrame.from_dict(binance_stats, orient='index').reindex(symbols)
+    tv = pd.DataFrame.from_dict(tv_indicators, orient='index', dtype=float)
+    tv = tv.reindex(index=symbols, columns=TV_INDICATORS)
+    has_tv = np.array([bool(tv_indicators.get(s)) for s in symbols])
+
+    price = _column(stats, 'price', 0)
+
+    df = pd.DataFrame(index=symbols)
+    df['symbol'] = symbols
+    df['price_usd'] = price
+    df['price_kes'] = price * usd_to_kes
+    df['change_24h'] = _column(stats, 'change_24h', 0)
+    df['volume_24h_usd'] = _column(stats, 'quote_volume_24h', 0)
+    df['high_24h'] = _column(stats, 'high_24h', 0)
+    df['low_24h'] = _column(stats, 'low_24h', 0)
+    df['stale'] = _column(stats, 'stale', False).eq(True)
+
+    for key, indicator in TV_ANALYSIS_FIELDS:
+        df[key] = tv[indicator]
+        if key == 'rsi':
+            df['rsi_signal'] = rsi_signals(tv['RSI'])
+
+    # Rows without TradingView data have all-NaN indicators, which
+    # classify as NEUTRAL signals
+    df['signal_overall'] = recommendation_signals(tv['Recommend.All'])
+    df['signal_ma'] = recommendation_signals(tv['Recommend.MA'])
+    df['signal_oscillators'] = recommendation_signals(tv['Recommend.Other'])
+
+    ema20 = tv['EMA20']
+    ema50 = tv['EMA50']
+    # The trend needs a price and both EMAs present and non-zero; a NaN EMA
+    # counts as present and falls through to SIDEWAYS
+    has_emas = np.array([
+        bool(tv_indicators.get(s)) and bool(tv_indicators[s].get('EMA20')) and bool(tv_indicators[s].get('EMA50'))
+        for s in symbols
+    ])
+    has_trend = has_emas & price.ne(0).to_numpy()
+    df['trend'] = np.select(
+        [~has_trend, (price > ema20) & (ema20 > ema50), (price < ema20) & (ema20 < ema50)],
+        ["UNKNOWN", "UPTREND", "DOWNTREND"],
+        default="SIDEWAYS"
+    )
+
+    analyses = _to_records(df)
+    for analysis, tv_ok in zip(analyses, has_tv):
+        if not tv_ok:
+            for key in TV_ONLY_KEYS:
+                del analysis[key]
+    return analyses
+
+def _compute_levels(prices: np.ndarray, is_long: np.ndarray):
+    """Stop loss and targets per symbol: LONG stops 2% below with targets 2%/4% above, SHORT mirrored"""
+    stop_loss = np.where(is_long, prices * 0.98, prices * 1.02)
+    target1 = np.where(is_long, prices * 1.02, prices * 0.98)
+    target2 = np.where(is_long, prices * 1.04, prices * 0.96)
+    return stop_loss, target1, target2
 
 def generate_trading_opportunities(analyses: List[Dict]) -> List[Dict]:
     """Generate trading opportunities from analysis"""
-    opportunities = []
-
-    for analysis in analyses:
-        signal = analysis.get('signal_overall', 'NEUTRAL')
-        trend = analysis.get('trend', 'UNKNOWN')
-        rsi = analysis.get('rsi')
-        change_24h = analysis.get('change_24h', 0)
-
-        # Skip neutral signals
-        if signal == 'NEUTRAL':
-            continue
-
-        # Determine trade setup
-        if signal in ['STRONG_BUY', 'BUY']:
-            side = 'LONG'
-            if rsi and rsi < 35:
-                confidence = 'HIGH'
-                reason = "Oversold bounce opportunity"
-            elif trend == 'UPTREND':
-                confidence = 'MEDIUM-HIGH'
-                reason = "Trend continuation"
-            else:
-                confidence = 'MEDIUM'
-                reason = "Bullish signals"
-
-        elif signal in ['STRONG_SELL', 'SELL']:
-            side = 'SHORT'
-            if rsi and rsi > 65:
-                confidence = 'HIGH'
-                reason = "Overbought reversal"
-            elif trend == 'DOWNTREND':
-                confidence = 'MEDIUM-HIGH'
-                reason = "Trend continuation"
-            else:
-                confidence = 'MEDIUM'
-                reason = "Bearish signals"
-        else:
-            continue
-
-        price = analysis['price_usd']
-
-        # Calculate levels
-        if side == 'LONG':
-            stop_loss = price * 0.98  # 2% below
-            target1 = price * 1.02  # 2% above
-            target2 = price * 1.04  # 4% above
-        else:
-            stop_loss = price * 1.02  # 2% above
-            target1 = price * 0.98  # 2% below
-            target2 = price * 0.96  # 4% below
-
-        opportunities.append({
-            'symbol': analysis['symbol'],
-            'side': side,
-            'signal': signal,
-            'confidence': confidence,
-            'reason': reason,
-            'entry_price': price,
-            'stop_loss': stop_loss,
-            'target1': target1,
-            'target2': target2,
-            'rsi': rsi,
-            'trend': trend,
-            'change_24h': change_24h
-        })
+    if not analyses:
+        return []
+
+    df = pd.DataFrame(analyses)
+    signal = _column(df, 'signal_overall', 'NEUTRAL')
+
+    # Only directional signals become trade setups
+    is_long = signal.isin(['STRONG_BUY', 'BUY']).to_numpy()
+    is_short = signal.isin(['STRONG_SELL', 'SELL']).to_numpy()
+    keep = is_long | is_short
+    if not keep.any():
+        return []
+
+    df = df[keep]
+    is_long = is_long[keep]
+    is_short = is_short[keep]
+
+    trend = _column(df, 'trend', 'UNKNOWN')
+    rsi = pd.to_numeric(_column(df, 'rsi', np.nan))
+    has_rsi = rsi.fillna(0).ne(0)
+
+    long_oversold = is_long & (has_rsi & (rsi < 35)).to_numpy()
+    long_trend = is_long & (trend == 'UPTREND').to_numpy()
+    short_overbought = is_short & (has_rsi & (rsi > 65)).to_numpy()
+    short_trend = is_short & (trend == 'DOWNTREND').to_numpy()
+
+    confidence_rank = np.select(
+        [long_oversold, long_trend, is_long, short_overbought, short_trend],
+        [Confidence.HIGH, Confidence.MEDIUM_HIGH, Confidence.MEDIUM, Confidence.HIGH, Confidence.MEDIUM_HIGH],
+        default=Confidence.MEDIUM
+    )
+    reason = np.select(
+        [long_oversold, long_trend, is_long, short_overbought, short_trend],
+        ["Oversold bounce opportunity", "Trend continuation", "Bullish signals",
+         "Overbought reversal", "Trend continuation"],
+        default="Bearish signals"
+    )
+
+    price = df['price_usd']
+    stop_loss, target1, target2 = _compute_levels(price.to_numpy(dtype=np.float64), is_long)
+
+    opps = pd.DataFrame({
+        'symbol': df['symbol'],
+        'side': np.where(is_long, 'LONG', 'SHORT'),
+        'signal': signal[keep],
+        'confidence': CONFIDENCE_NAMES[confidence_rank],
+        'confidence_rank': confidence_rank,
+        'reason': reason,
+        'entry_price': price,
+        'stop_loss': stop_loss,
+        'target1': target1,
+        'target2': target2,
+        'rsi': rsi,
+        'trend': trend,
+        'change_24h': _column(df, 'change_24h', 0),
+    })
+    opportunities = _to_records(opps)
 
     # Sort by confidence
-    confidence_order = {'HIGH': 0, 'MEDIUM-HIGH': 1, 'MEDIUM': 2, 'MEDIUM-LOW': 3, 'LOW': 4}
-    opportunities.sort(key=lambda x: confidence_order.get(x['confidence'], 5))
+    opportunities.sort(key=itemgetter('confidence_rank'))
 
     return opportunities
 
 # ==================== REPORT GENERATION ====================
 
+def market_summary(analyses: List[Dict]) -> Tuple[int, int, float]:
+    """Count bullish and bearish coins and average the 24h change in one pass"""
+    bullish = 0
+    total = 0.0
+    for a in analyses:
+        change = a.get('change_24h', 0)
+        total += change
+        bullish += change > 0
+    n = len(analyses)
+    return bullish, n - bullish, total / n if n else 0
+
+def _volume_key(a: Dict) -> float:
+    """Sort key for the price table: 24h quote volume"""
+    return a.get('quote_volume_24h') or a.get('volume_24h_usd', 0)
+
+def format_prices(prices, prefix: str, tier_prices=None) -> np.ndarray:
+    """
+    Format prices for display in one vectorized pass
+
+    Precision follows the USD price tier (tier_prices, default prices):
+    no decimals from 1000, two decimals from 1, four decimals below 1.
+    """
+    prices = pd.Series(prices, dtype=float)
+    tiers = prices if tier_prices is None else pd.Series(tier_prices, dtype=float)
+    return np.where(
+        tiers >= 1000,
+        prices.map((prefix + "{:,.0f}").format),
+        np.where(
+            tiers >= 1,
+            prices.map((prefix + "{:,.2f}").format),
+            prices.map((prefix + "{:.4f}").format)
+        )
+    )
+
+def render_price_rows(analyses: List[Dict]) -> str:
+    """Render the price table rows for analyses (in the given order) column-wise"""
+    if not analyses:
+        return ""
+
+    df = pd.DataFrame(analyses)
+    change = _column(df, 'change_24h', 0)
+
+    columns = [
+        pd.Series(format_prices(df['price_usd'], "$"), index=df.index),
+        pd.Series(format_prices(df['price_kes'], "KSh ", tier_prices=df['price_usd']), index=df.index),
+        np.where(change >= 0, "+", "") + change.map("{:.2f}%".format),
+        _column(df, 'signal_overall', 'N/A').astype(str),
+        _column(df, 'trend', 'N/A').astype(str),
+    ]
+    coin = df['symbol'].str.replace('USDT', '', regex=False)
+    rows = "| " + coin.str.cat(columns, sep=" | ") + " |"
+    return "\n".join(rows)
+
+def _write_opportunity(buf: io.StringIO, opp: Dict) -> None:
+    """Write one trading opportunity section"""
+    symbol = opp['symbol'].replace('USDT', '')
+    side = opp['side']
+    entry = opp['entry_price']
+    sl = opp['stop_loss']
+    tp1 = opp['target1']
+    tp2 = opp['target2']
+
+    emoji = "🟢" if side == "LONG" else "🔴"
+
+    buf.write(
+        f"### {emoji} {symbol} - {side}\n"
+        f"\n"
+        f"- **Signal:** {opp['signal']}\n"
+        f"- **Confidence:** {opp['confidence']}\n"
+        f"- **Reason:** {opp['reason']}\n"
+        f"- **Entry:** ${entry:,.2f}\n"
+        f"- **Stop Loss:** ${sl:,.2f} ({((sl-entry)/entry)*100:+.1f}%)\n"
+        f"- **Target 1:** ${tp1:,.2f} ({((tp1-entry)/entry)*100:+.1f}%)\n"
+        f"- **Target 2:** ${tp2:,.2f} ({((tp2-entry)/entry)*100:+.1f}%)\n"
+    )
+    rsi = opp.get('rsi')
+    if rsi:
+        buf.write(f"- **RSI:** {rsi:.1f}\n")
+    buf.write("\n")
+
+def _write_technical_details(buf: io.StringIO, a: Dict) -> None:
+    """Write the indicator table for one coin"""
+    symbol = a['symbol'].replace('USDT', '')
+    buf.write(
+        f"### {symbol}\n"
+        f"\n"
+        f"| Indicator | Value | Signal |\n"
+        f"|-----------|-------|--------|\n"
+    )
+
+    g = a.get
+    rsi = g('rsi')
+    macd = g('macd')
+    adx = g('adx')
+
+    if rsi:
+        buf.write(f"| RSI (14) | {rsi:.1f} | {g('rsi_signal', 'N/A')} |\n")
+    if macd is not None:
+        macd_status = "Bullish" if macd > (g('macd_signal') or 0) else "Bearish"
+        buf.write(f"| MACD | {macd:.4f} | {macd_status} |\n")
+    if adx:
+        adx_status = "Strong" if adx > 25 else "Weak"
+        buf.write(f"| ADX | {adx:.1f} | {adx_status} |\n")
+
+    buf.write(
+        f"| Trend | {g('trend', 'N/A')} | - |\n"
+        f"| Overall Signal | {g('signal_overall', 'N/A')} | - |\n"
+        f"\n"
+    )
+
 def generate_markdown_report(
     analyses: List[Dict],
     opportunities: List[Dict],
@@ -350,127 +633,65 @@ def generate_markdown_report(
 ) -> str:
     """Generate markdown report"""
 
-    report = []
-    report.append(f"# Major Cryptocurrencies Analysis")
-    report.append(f"")
-    report.append(f"**Generated:** {timestamp.strftime('%Y-%m-%d %H:%M:%S')} EAT (Nairobi)")
-    report.append(f"**USD/KES Rate:** {usd_to_kes:.2f}")
-    report.append(f"**Coins Analyzed:** {len(analyses)}")
-    report.append(f"")
-    report.append(f"---")
-    report.append(f"")
+    buf = io.StringIO()
+    buf.write(
+        f"# Major Cryptocurrencies Analysis\n"
+        f"\n"
+        f"**Generated:** {timestamp.strftime('%Y-%m-%d %H:%M:%S')} EAT (Nairobi)\n"
+        f"**USD/KES Rate:** {usd_to_kes:.2f}\n"
+        f"**Coins Analyzed:** {len(analyses)}\n"
+    )
+    if any(a.get('stale') for a in analyses):
+        buf.write("**Data:** stale data - Binance unavailable, using last saved 24h stats\n")
+    buf.write("\n---\n\n")
 
     # Market Summary
-    report.append(f"## Market Summary")
-    report.append(f"")
-
-    bullish = sum(1 for a in analyses if a.get('change_24h', 0) > 0)
-    bearish = len(analyses) - bullish
-    avg_change = sum(a.get('change_24h', 0) for a in analyses) / len(analyses) if analyses else 0
-
-    report.append(f"- **Bullish:** {bullish} coins ({bullish/len(analyses)*100:.0f}%)")
-    report.append(f"- **Bearish:** {bearish} coins ({bearish/len(analyses)*100:.0f}%)")
-    report.append(f"- **Average 24h Change:** {avg_change:+.2f}%")
-    report.append(f"")
-
-    # Price Table
-    report.append(f"## Current Prices")
-    report.append(f"")
-    report.append(f"| Coin | Price (USD) | Price (KES) | 24h Change | Signal | Trend |")
-    report.append(f"|------|-------------|-------------|------------|--------|-------|")
-
-    for a in sorted(analyses, key=lambda x: x.get('quote_volume_24h', 0) if x.get('quote_volume_24h') else x.get('volume_24h_usd', 0), reverse=True):
-        symbol = a['symbol'].replace('USDT', '')
-        price_usd = a['price_usd']
-        price_kes = a['price_kes']
-        change = a.get('change_24h', 0)
-        signal = a.get('signal_overall', 'N/A')
-        trend = a.get('trend', 'N/A')
-
-        change_str = f"+{change:.2f}%" if change >= 0 else f"{change:.2f}%"
-
-        if price_usd >= 1000:
-            price_usd_str = f"${price_usd:,.0f}"
-            price_kes_str = f"KSh {price_kes:,.0f}"
-        elif price_usd >= 1:
-            price_usd_str = f"${price_usd:,.2f}"
-            price_kes_str = f"KSh {price_kes:,.2f}"
-        else:
-            price_usd_str = f"${price_usd:.4f}"
-            price_kes_str = f"KSh {price_kes:.4f}"
-
-        report.append(f"| {symbol} | {price_usd_str} | {price_kes_str} | {change_str} | {signal} | {trend} |")
-
-    report.append(f"")
+    bullish, bearish, avg_change = market_summary(analyses)
+    pct = 100 / (len(analyses) or 1)
+
+    buf.write(
+        f"## Market Summary\n"
+        f"\n"
+        f"- **Bullish:** {bullish} coins ({bullish*pct:.0f}%)\n"
+        f"- **Bearish:** {bearish} coins ({bearish*pct:.0f}%)\n"
+        f"- **Average 24h Change:** {avg_change:+.2f}%\n"
+        f"\n"
+    )
+
+    # Price Table, highest volume first
+    by_volume = sorted(analyses, key=_volume_key, reverse=True)
+    buf.write(
+        "## Current Prices\n"
+        "\n"
+        "| Coin | Price (USD) | Price (KES) | 24h Change | Signal | Trend |\n"
+        "|------|-------------|-------------|------------|--------|-------|\n"
+    )
+    buf.write(render_price_rows(by_volume))
+    buf.write("\n\n" if by_volume else "\n")
 
     # Trading Opportunities
+    buf.write("## Trading Opportunities\n\n")
     if opportunities:
-        report.append(f"## Trading Opportunities")
-        report.append(f"")
-        report.append(f"Found **{len(opportunities)}** potential setups:")
-        report.append(f"")
-
+        buf.write(f"Found **{len(opportunities)}** potential setups:\n\n")
         for opp in opportunities:
-            symbol = opp['symbol'].replace('USDT', '')
-            side = opp['side']
-            confidence = opp['confidence']
-            reason = opp['reason']
-            entry = opp['entry_price']
-            sl = opp['stop_loss']
-            tp1 = opp['target1']
-            tp2 = opp['target2']
-
-            emoji = "🟢" if side == "LONG" else "🔴"
-
-            report.append(f"### {emoji} {symbol} - {side}")
-            report.append(f"")
-            report.append(f"- **Signal:** {opp['signal']}")
-            report.append(f"- **Confidence:** {confidence}")
-            report.append(f"- **Reason:** {reason}")
-            report.append(f"- **Entry:** ${entry:,.2f}")
-            report.append(f"- **Stop Loss:** ${sl:,.2f} ({((sl-entry)/entry)*100:+.1f}%)")
-            report.append(f"- **Target 1:** ${tp1:,.2f} ({((tp1-entry)/entry)*100:+.1f}%)")
-            report.append(f"- **Target 2:** ${tp2:,.2f} ({((tp2-entry)/entry)*100:+.1f}%)")
-            if opp.get('rsi'):
-                report.append(f"- **RSI:** {opp['rsi']:.1f}")
-            report.append(f"")
+            _write_opportunity(buf, opp)
     else:
-        report.append(f"## Trading Opportunities")
-        report.append(f"")
-        report.append(f"No strong trading opportunities identified at this time.")
-        report.append(f"")
+        buf.write("No strong trading opportunities identified at this time.\n\n")
 
     # Technical Analysis Details
-    report.append(f"## Technical Analysis Details")
-    report.append(f"")
-
+    buf.write("## Technical Analysis Details\n\n")
     for a in analyses[:5]:  # Top 5 by volume
-        symbol = a['symbol'].replace('USDT', '')
-        report.append(f"### {symbol}")
-        report.append(f"")
-        report.append(f"| Indicator | Value | Signal |")
-        report.append(f"|-----------|-------|--------|")
-
-        if a.get('rsi'):
-            report.append(f"| RSI (14) | {a['rsi']:.1f} | {a.get('rsi_signal', 'N/A')} |")
-        if a.get('macd') is not None:
-            macd_status = "Bullish" if a['macd'] > (a.get('macd_signal') or 0) else "Bearish"
-            report.append(f"| MACD | {a['macd']:.4f} | {macd_status} |")
-        if a.get('adx'):
-            adx_status = "Strong" if a['adx'] > 25 else "Weak"
-            report.append(f"| ADX | {a['adx']:.1f} | {adx_status} |")
-
-        report.append(f"| Trend | {a.get('trend', 'N/A')} | - |")
-        report.append(f"| Overall Signal | {a.get('signal_overall', 'N/A')} | - |")
-        report.append(f"")
+        _write_technical_details(buf, a)
 
     # Footer
-    report.append(f"---")
-    report.append(f"")
-    report.append(f"*Analysis generated automatically by Nairobi Trading System*")
-    report.append(f"*Next analysis scheduled in 4 hours*")
+    buf.write(
+        "---\n"
+        "\n"
+        "*Analysis generated automatically by Nairobi Trading System*\n"
+        "*Next analysis scheduled in 4 hours*"
+    )
 
-    return "\n".join(report)
+    return buf.getvalue()
 
 # ==================== MAIN FUNCTION ====================
 
@@ -486,33 +707,32 @@ def run_automated_analysis():
     print(f"Timestamp: {timestamp.strftime('%Y-%m-%d %H:%M:%S')} EAT")
     print("=" * 80)
 
-    # Get exchange rate
+    # Exchange rate, Binance 24h stats and TradingView indicators are
+    # independent, so fetch them concurrently
     print("\nFetching USD/KES exchange rate...")
-    usd_to_kes = get_usd_to_kes_rate()
-    print(f"USD/KES Rate: {usd_to_kes:.2f}")
+    print(f"Fetching Binance data for {len(MAJOR_SYMBOLS)} symbols...")
+    if HAS_TRADINGVIEW:
+        print("Fetching TradingView indicators (1h timeframe)...")
+    else:
+        print("Skipping TradingView (not installed)")
 
-    # Get Binance 24h stats
-    print(f"\nFetching Binance data for {len(MAJOR_SYMBOLS)} symbols...")
-    binance_stats = get_binance_24h_stats(MAJOR_SYMBOLS)
-    print(f"Received data for {len(binance_stats)} symbols")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        fx_future = executor.submit(get_usd_to_kes_rate)
+        stats_future = executor.submit(get_binance_24h_stats, MAJOR_SYMBOLS)
+        tv_future = executor.submit(get_tradingview_indicators, MAJOR_SYMBOLS, '1h') if HAS_TRADINGVIEW else None
 
-    # Get TradingView indicators
+        usd_to_kes = fx_future.result()
+        binance_stats = stats_future.result()
+        tv_indicators_1h = tv_future.result() if tv_future else {}
+
+    print(f"\nUSD/KES Rate: {usd_to_kes:.2f}")
+    print(f"Received data for {len(binance_stats)} symbols")
     if HAS_TRADINGVIEW:
-        print("\nFetching TradingView indicators (1h timeframe)...")
-        tv_indicators_1h = get_tradingview_indicators(MAJOR_SYMBOLS, '1h')
         print(f"Received TV data for {len(tv_indicators_1h)} symbols")
-    else:
-        print("\nSkipping TradingView (not installed)")
-        tv_indicators_1h = {}
 
     # Analyze each coin
     print("\nAnalyzing coins...")
-    analyses = []
-    for symbol in MAJOR_SYMBOLS:
-        if symbol in binance_stats:
-            tv_data = tv_indicators_1h.get(symbol, {})
-            analysis = analyze_coin(symbol, binance_stats[symbol], tv_data, usd_to_kes)
-            analyses.append(analysis)
+    analyses = analyze_coins(binance_stats, tv_indicators_1h, usd_to_kes, MAJOR_SYMBOLS)
 
     print(f"Analyzed {len(analyses)} coins")
 
@@ -529,8 +749,10 @@ def run_automated_analysis():
     report_filename = f"majors-analysis-{timestamp.strftime('%Y-%m-%d-%H-%M')}.md"
     report_path = Path(__file__).parent / report_filename
 
-    with open(report_path, 'w', encoding='utf-8') as f:
-        f.write(report)
+    # Write to a temp file and rename so readers never see a partial report
+    tmp_path = report_path.with_suffix('.md.tmp')
+    tmp_path.write_bytes(report.encode('utf-8'))
+    os.replace(tmp_path, report_path)
 
     print(f"\nReport saved: {report_filename}")
 
@@ -539,11 +761,14 @@ def run_automated_analysis():
     log_dir.mkdir(exist_ok=True)
 
     log_file = log_dir / "analysis_runs.log"
-    with open(log_file, 'a', encoding='utf-8') as f:
-        f.write(f"\n[{timestamp.strftime('%Y-%m-%d %H:%M:%S')}] Analysis completed\n")
-        f.write(f"  - Coins analyzed: {len(analyses)}\n")
-        f.write(f"  - Opportunities found: {len(opportunities)}\n")
-        f.write(f"  - Report: {report_filename}\n")
+    log_entry = (
+        f"\n[{timestamp.strftime('%Y-%m-%d %H:%M:%S')}] Analysis completed\n"
+        f"  - Coins analyzed: {len(analyses)}\n"
+        f"  - Opportunities found: {len(opportunities)}\n"
+        f"  - Report: {report_filename}\n"
+    )
+    with open(log_file, 'ab') as f:
+        f.write(log_entry.encode('utf-8'))
 
     # Summary
     print("\n" + "=" * 80)
@@ -551,8 +776,7 @@ def run_automated_analysis():
     print("=" * 80)
 
     # Quick market summary
-    bullish = sum(1 for a in analyses if a.get('change_24h', 0) > 0)
-    bearish = len(analyses) - bullish
+    bullish, bearish, _ = market_summary(analyses)
 
     print(f"\nMarket: {bullish} bullish, {bearish} bearish")
 
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-Time Build for the Scoring Kernel
+Compiles score_row_nb from trading_indicators_nb.py into a native extension
+(trading_metrics_aot) with numba.pycc, so Cloud Functions cold starts don't
+pay for JIT compilation.
+
+trading_metrics.py imports the extension when it is on the path and falls
+back to the JIT kernel otherwise. Rebuild after changing the rating rules or
+thresholds, and build on the same platform/Python version as the deployment.
+
+Usage:
+    python build_aot.py [OUTPUT_DIR]    # default: functions/
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from numba.pycc import CC
+
+from trading_indicators_nb import SCORE_ROW_SIGNATURE, score_row_nb
+
+cc = CC("trading_metrics_aot")
+
+
+@cc.export("score_row", SCORE_ROW_SIGNATURE)
+def score_row(
+    close, bb_upper, bb_middle, bb_lower,
+    stoch_k, stoch_d,
+    macd, macd_signal_line, macd_histogram,
+    adx, plus_di, minus_di,
+    cci,
+    w_bb, w_stoch, w_macd, w_adx, w_cci,
+):
+    return score_row_nb(
+        close, bb_upper, bb_middle, bb_lower,
+        stoch_k, stoch_d,
+        macd, macd_signal_line, macd_histogram,
+        adx, plus_di, minus_di,
+        cci,
+        w_bb, w_stoch, w_macd, w_adx, w_cci,
+    )
+
+
+def main():
+    """Compile the extension into OUTPUT_DIR"""
+    default_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "functions")
+    cc.output_dir = sys.argv[1] if len(sys.argv) > 1 else default_dir
+    cc.verbose = True
+    cc.compile()
+    print(f"Built {cc.name} in {cc.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
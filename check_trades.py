@@ -11,80 +11,189 @@ NO USER INPUT REQUIRED - Runs completely automatically
 import sys
 import os
 import json
-import requests
-from datetime import datetime
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 # Add project to path
 sys.path.append(str(Path(__file__).parent))
 
 from paper_trading_db import PaperTradingDB
 
-# Try to import pytz, fall back to manual offset if not available
+# orjson is optional; falls back to stdlib json for parsing responses
 try:
-    import pytz
-    EAT = pytz.timezone('Africa/Nairobi')
-    def get_nairobi_time():
-        return datetime.now(EAT)
+    import orjson
 except ImportError:
-    from datetime import timezone, timedelta
-    EAT_OFFSET = timezone(timedelta(hours=3))
-    def get_nairobi_time():
-        return datetime.now(EAT_OFFSET)
+    orjson = None
+
+# ijson is optional; lets the full ticker list be stream-parsed instead of buffered
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Errors raised when a Binance response body is not valid JSON
+JSON_ERRORS = (json.JSONDecodeError,) if ijson is None else (json.JSONDecodeError, ijson.JSONError)
+
+# Nairobi has no DST, so a fixed UTC+3 offset is used if the tz database is unavailable
+try:
+    EAT = ZoneInfo('Africa/Nairobi')
+except ZoneInfoNotFoundError:
+    EAT = timezone(timedelta(hours=3))
+
+def get_nairobi_time():
+    return datetime.now(EAT)
 
 # Binance API endpoint
 BINANCE_API_BASE = "https://api.binance.com/api/v3"
 
+# Longest symbols=[...] filter sent to Binance before falling back to the full ticker list
+MAX_SYMBOLS_PARAM_LENGTH = 8000
+
 # USD to KES rate (update periodically)
 USD_TO_KES = 129.50
 
+# USD to KES rate cache; the rate changes on the order of hours
+FX_CACHE_PATH = Path(__file__).parent / "logs" / "fx_cache.json"
+FX_CACHE_TTL = 6 * 3600
+
+# Position table layout: header, separator and a preparsed row formatter
+_TABLE_HEADER = f"{'Symbol':<12} {'Side':<6} {'Entry':<12} {'Current':<12} {'P&L%':<10} {'Status':<12} {'Action'}"
+_TABLE_SEPARATOR = "-" * 90
+_ROW_FMT = "{:<12} {:<6} ${:<11,.2f} ${:<11,.2f} {:<10} {:<12} {}".format
+
+# Shared HTTP session: keep-alive connections are reused across calls
+_SESSION = None
+
+# requests' base exception class, set by _get_session() when requests is imported
+RequestException = None
+
+def _get_session():
+    """Get the shared HTTP session, importing requests and creating it on first use"""
+    global _SESSION, RequestException
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from requests.exceptions import RequestException
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        session.headers.update({'Accept-Encoding': 'gzip', 'Connection': 'keep-alive'})
+        session.mount("https://", HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        ))
+        _SESSION = session
+    return _SESSION
+
+def _stream_ticker_prices(url, symbols):
+    """Stream-parse the full ticker list, stopping once every requested symbol is found"""
+    remaining = set(symbols)
+    prices = {}
+    with _get_session().get(url, stream=True, timeout=10) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        for item in ijson.items(response.raw, 'item'):
+            symbol = item['symbol']
+            if symbol in remaining:
+                prices[symbol] = float(item['price'])
+                remaining.discard(symbol)
+                if not remaining:
+                    break
+    return prices
+
 def get_current_prices_from_binance(symbols):
     """
     Fetch current prices directly from Binance REST API
     No authentication required for public market data
     """
+    session = _get_session()
     prices = {}
+    url = f"{BINANCE_API_BASE}/ticker/price"
+    symbols_param = json.dumps(list(symbols), separators=(',', ':'))
 
     try:
-        # Fetch all ticker prices in one call
-        response = requests.get(f"{BINANCE_API_BASE}/ticker/price", timeout=10)
-        response.raise_for_status()
-
-        all_prices = response.json()
+        # Ask Binance for just our symbols; fall back to the full ticker list
+        # for very large symbol sets (URL length) or when Binance rejects the
+        # filter because a symbol is unknown (e.g. delisted)
+        response = None
+        if len(symbols_param) <= MAX_SYMBOLS_PARAM_LENGTH:
+            response = session.get(url, params={'symbols': symbols_param}, timeout=10)
+        full_list = response is None or response.status_code == 400
+
+        if full_list and ijson is not None:
+            prices = _stream_ticker_prices(url, symbols)
+        else:
+            if full_list:
+                response = session.get(url, timeout=10)
+            response.raise_for_status()
 
-        # Create lookup dictionary
-        price_lookup = {item['symbol']: float(item['price']) for item in all_prices}
+            # Binance returns prices as strings, so the float() cast stays
+            all_prices = orjson.loads(response.content) if orjson is not None else response.json()
+            wanted = set(symbols)
+            for item in all_prices:
+                if item['symbol'] in wanted:
+                    prices[item['symbol']] = float(item['price'])
 
-        # Get prices for our symbols
         for symbol in symbols:
-            if symbol in price_lookup:
-                prices[symbol] = price_lookup[symbol]
-            else:
+            if symbol not in prices:
                 print(f"Warning: {symbol} not found in Binance data")
 
         return prices
 
-    except requests.exceptions.RequestException as e:
+    except RequestException as e:
         print(f"Error fetching prices from Binance: {e}")
         return None
-    except json.JSONDecodeError as e:
+    except JSON_ERRORS as e:
         print(f"Error parsing Binance response: {e}")
         return None
 
+def _load_cached_fx_rate():
+    """Return the cached USD to KES rate if it is younger than FX_CACHE_TTL, else None"""
+    try:
+        cached = json.loads(FX_CACHE_PATH.read_text(encoding='utf-8'))
+        if time.time() - cached['ts'] < FX_CACHE_TTL:
+            return cached['rate']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+def _save_cached_fx_rate(rate):
+    """Cache the USD to KES rate on disk (atomic write)"""
+    try:
+        FX_CACHE_PATH.parent.mkdir(exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=FX_CACHE_PATH.parent, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'ts': time.time(), 'rate': rate}, f)
+        os.replace(tmp_path, FX_CACHE_PATH)
+    except OSError as e:
+        print(f"Warning: could not cache exchange rate: {e}")
+
 def get_usd_to_kes_rate():
     """
     Get current USD to KES exchange rate
-    Falls back to default if API fails
+    Uses the on-disk cache while fresh, falls back to default if API fails
     """
+    cached_rate = _load_cached_fx_rate()
+    if cached_rate is not None:
+        return cached_rate
+
     try:
         # Try exchangerate-api (free tier)
-        response = requests.get(
+        response = _get_session().get(
             "https://api.exchangerate-api.com/v4/latest/USD",
             timeout=5
         )
         if response.status_code == 200:
             data = response.json()
-            return data.get('rates', {}).get('KES', USD_TO_KES)
+            rate = data.get('rates', {}).get('KES')
+            if rate is not None:
+                _save_cached_fx_rate(rate)
+                return rate
     except:
         pass
 
@@ -97,18 +206,19 @@ def format_pnl(pnl_percent):
     else:
         return f"{pnl_percent:.2f}%"
 
+# Action description for each new trade status; TP1 being reached is handled separately
+_STATUS_ACTIONS = {
+    'STOPPED': "[CLOSED - Stop Loss Hit]",
+    'TP2_HIT': "[CLOSED - Target 2 Hit]",
+    'OPEN': "[Monitoring]",
+    'TP1_HIT': "[Monitoring]",
+}
+
 def get_status_action(old_status, new_status, side):
     """Get action description based on status change"""
-    if new_status == 'STOPPED':
-        return "[CLOSED - Stop Loss Hit]"
-    elif new_status == 'TP2_HIT':
-        return "[CLOSED - Target 2 Hit]"
-    elif new_status == 'TP1_HIT' and old_status == 'OPEN':
+    if new_status == 'TP1_HIT' and old_status == 'OPEN':
         return "[Target 1 Reached]"
-    elif new_status in ('OPEN', 'TP1_HIT'):
-        return "[Monitoring]"
-    else:
-        return f"[{new_status}]"
+    return _STATUS_ACTIONS.get(new_status) or f"[{new_status}]"
 
 def check_trades_automated():
     """
@@ -118,8 +228,18 @@ def check_trades_automated():
     db = PaperTradingDB()
     now = get_nairobi_time()
 
-    # Get USD to KES rate
-    usd_to_kes = get_usd_to_kes_rate()
+    # Get open positions
+    open_trades = db.get_open_trades()
+
+    # Get unique symbols from the trades already loaded
+    symbols = sorted({trade['symbol'] for trade in open_trades})
+
+    # Fetch the USD to KES rate and current Binance prices concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        fx_future = executor.submit(get_usd_to_kes_rate)
+        prices_future = executor.submit(get_current_prices_from_binance, symbols) if open_trades else None
+        usd_to_kes = fx_future.result()
+        current_prices = prices_future.result() if prices_future else None
 
     print("\n" + "=" * 80)
     print("=== PAPER TRADING POSITION CHECK ===")
@@ -128,32 +248,26 @@ def check_trades_automated():
     print(f"USD/KES Rate: {usd_to_kes:.2f}")
     print("=" * 80)
 
-    # Get open positions
-    open_trades = db.get_open_trades()
-
     if not open_trades:
         print("\nNo open positions.\n")
         log_check(now, 0, 0, [], usd_to_kes)
         return
 
-    # Get unique symbols
-    symbols = list(set(trade['symbol'] for trade in open_trades))
-
     print(f"\nFetching prices for {len(symbols)} symbols from Binance...")
 
-    # Fetch current prices from Binance
-    current_prices = get_current_prices_from_binance(symbols)
-
     if current_prices is None:
         print("ERROR: Could not fetch prices from Binance. Skipping check.")
         return
 
     print(f"Prices fetched successfully.\n")
 
+    # Collect the report lines and write them to stdout in one call
+    lines = []
+
     # Display header
-    print(f"POSITION STATUS ({len(open_trades)} trades checked)\n")
-    print(f"{'Symbol':<12} {'Side':<6} {'Entry':<12} {'Current':<12} {'P&L%':<10} {'Status':<12} {'Action'}")
-    print("-" * 90)
+    lines.append(f"POSITION STATUS ({len(open_trades)} trades checked)\n")
+    lines.append(_TABLE_HEADER)
+    lines.append(_TABLE_SEPARATOR)
 
     # Track results
     closed_trades = []
@@ -161,25 +275,26 @@ def check_trades_automated():
     alerts = []
     portfolio_pnl_usd = 0
 
-    for trade in open_trades:
+    # Split off trades without price data once, reporting each missing symbol a single time
+    missing = {symbol for symbol in symbols if symbol not in current_prices}
+    for symbol in sorted(missing):
+        lines.append(f"{symbol:<12} - ERROR: No price data")
+    live = [trade for trade in open_trades if trade['symbol'] not in missing]
+
+    # Update all trade checks in one database transaction (this handles auto-close)
+    checks = [
+        (t['trade_id'], current_prices[t['symbol']], current_prices[t['symbol']] * usd_to_kes)
+        for t in live
+    ]
+    check_results = db.update_trade_checks_bulk(checks)
+
+    for trade, result in zip(live, check_results):
         symbol = trade['symbol']
         side = trade['side']
         entry = trade['entry_price_usd']
         old_status = trade['status']
         position_size = trade['position_size_usd']
-
-        # Get current price
-        current_price = current_prices.get(symbol)
-        if current_price is None:
-            print(f"{symbol:<12} {side:<6} - ERROR: No price data")
-            continue
-
-        # Update trade check in database (this handles auto-close)
-        result = db.update_trade_check(
-            trade['trade_id'],
-            current_price,
-            current_price * usd_to_kes
-        )
+        current_price = current_prices[symbol]
 
         # Get results
         unrealized_pnl = result.get('unrealized_pnl_percent', 0)
@@ -194,7 +309,7 @@ def check_trades_automated():
         # Format output
         pnl_str = format_pnl(unrealized_pnl)
 
-        print(f"{symbol:<12} {side:<6} ${entry:<11,.2f} ${current_price:<11,.2f} {pnl_str:<10} {new_status:<12} {action}")
+        lines.append(_ROW_FMT(symbol, side, entry, current_price, pnl_str, new_status, action))
 
         # Track closed vs open
         if new_status in ('STOPPED', 'TP2_HIT', 'CLOSED'):
@@ -219,32 +334,33 @@ def check_trades_automated():
         elif abs(unrealized_pnl) > 2 and new_status in ('OPEN', 'TP1_HIT'):
             alerts.append(f"WARNING: {symbol} {side} Large move: {pnl_str}")
 
-    print("-" * 90)
+    lines.append(_TABLE_SEPARATOR)
 
     # Summary section
     if closed_trades:
-        print(f"\nCLOSED THIS CHECK: {len(closed_trades)} positions")
+        lines.append(f"\nCLOSED THIS CHECK: {len(closed_trades)} positions")
         for ct in closed_trades:
             pnl_sign = '+' if ct['pnl_usd'] >= 0 else ''
-            print(f"  - {ct['symbol']} {ct['side']}: {format_pnl(ct['pnl_percent'])} (${pnl_sign}{ct['pnl_usd']:.2f}) - {ct['reason']}")
+            lines.append(f"  - {ct['symbol']} {ct['side']}: {format_pnl(ct['pnl_percent'])} (${pnl_sign}{ct['pnl_usd']:.2f}) - {ct['reason']}")
 
-    print(f"\nSTILL OPEN: {len(still_open)} positions")
+    lines.append(f"\nSTILL OPEN: {len(still_open)} positions")
 
     # Portfolio summary
     portfolio_pnl_kes = portfolio_pnl_usd * usd_to_kes
     avg_pnl_percent = (portfolio_pnl_usd / (len(still_open) * 1000)) * 100 if still_open else 0
 
-    print(f"Portfolio Unrealized P&L: ${portfolio_pnl_usd:+,.2f} (KSh {portfolio_pnl_kes:+,.2f}) | {format_pnl(avg_pnl_percent)}")
+    lines.append(f"Portfolio Unrealized P&L: ${portfolio_pnl_usd:+,.2f} (KSh {portfolio_pnl_kes:+,.2f}) | {format_pnl(avg_pnl_percent)}")
 
     # Alerts
     if alerts:
-        print(f"\n{'='*80}")
-        print(f"ALERTS ({len(alerts)}):")
+        lines.append(f"\n{'='*80}")
+        lines.append(f"ALERTS ({len(alerts)}):")
         for alert in alerts:
-            print(f"  {alert}")
+            lines.append(f"  {alert}")
 
-    print(f"\nNext check recommended: 15-30 minutes")
-    print("=" * 80 + "\n")
+    lines.append(f"\nNext check recommended: 15-30 minutes")
+    lines.append("=" * 80 + "\n")
+    sys.stdout.write('\n'.join(lines) + '\n')
 
     # Log to file
     log_check(now, len(open_trades), portfolio_pnl_usd, alerts, usd_to_kes, closed_trades)
@@ -256,26 +372,30 @@ def log_check(timestamp, position_count, portfolio_pnl, alerts, usd_to_kes, clos
 
     log_file = log_dir / "trade_checks.log"
 
-    with open(log_file, 'a', encoding='utf-8') as f:
-        f.write(f"\n{'='*60}\n")
-        f.write(f"Check Time: {timestamp.strftime('%Y-%m-%d %H:%M:%S')} EAT\n")
-        f.write(f"Open Positions: {position_count}\n")
-        f.write(f"Portfolio P&L: ${portfolio_pnl:+,.2f}\n")
-        f.write(f"USD/KES Rate: {usd_to_kes:.2f}\n")
-
-        if closed_trades:
-            f.write(f"Positions Closed: {len(closed_trades)}\n")
-            for ct in closed_trades:
-                f.write(f"  - {ct['symbol']} {ct['side']}: {ct['reason']}\n")
-
-        if alerts:
-            f.write(f"Alerts: {len(alerts)}\n")
-            for alert in alerts:
-                f.write(f"  {alert}\n")
-        else:
-            f.write("Alerts: None\n")
+    buf = []
+    buf.append(f"\n{'='*60}\n")
+    buf.append(f"Check Time: {timestamp.strftime('%Y-%m-%d %H:%M:%S')} EAT\n")
+    buf.append(f"Open Positions: {position_count}\n")
+    buf.append(f"Portfolio P&L: ${portfolio_pnl:+,.2f}\n")
+    buf.append(f"USD/KES Rate: {usd_to_kes:.2f}\n")
+
+    if closed_trades:
+        buf.append(f"Positions Closed: {len(closed_trades)}\n")
+        for ct in closed_trades:
+            buf.append(f"  - {ct['symbol']} {ct['side']}: {ct['reason']}\n")
+
+    if alerts:
+        buf.append(f"Alerts: {len(alerts)}\n")
+        for alert in alerts:
+            buf.append(f"  {alert}\n")
+    else:
+        buf.append("Alerts: None\n")
+
+    buf.append(f"{'='*60}\n")
 
-        f.write(f"{'='*60}\n")
+    # Append the whole entry in one call
+    with open(log_file, 'a', encoding='utf-8', buffering=64 * 1024) as f:
+        f.write(''.join(buf))
 
 if __name__ == "__main__":
     """
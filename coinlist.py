@@ -5,16 +5,27 @@ Utilities for loading symbol lists from text files.
 """
 
 import os
-from typing import List
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Tuple
 
 # Default coinlist directory (relative to project root)
 COINLIST_DIR = os.path.join(os.path.dirname(__file__), "coinlist")
 
 
+# Candidate file paths, tried in order: exact exchange name, then lowercase
+_PATH_TEMPLATES = (
+    os.path.join(COINLIST_DIR, "{e}.txt"),
+    os.path.join(COINLIST_DIR, "{le}.txt"),
+)
+
+
 def load_symbols(exchange: str) -> List[str]:
     """
     Load symbols for a given exchange, with multiple fallback strategies.
     
+    Files are read once per exchange; later calls are served from memory.
+    
     Args:
         exchange: Exchange name (e.g., 'BINANCE', 'KUCOIN')
         
@@ -27,29 +38,24 @@ def load_symbols(exchange: str) -> List[str]:
         >>> print(symbols[:3])
         ['BINANCE:BTCUSDT', 'BINANCE:ETHUSDT', 'BINANCE:SOLUSDT']
     """
-    # Try multiple possible paths
-    possible_paths = [
-        os.path.join(COINLIST_DIR, f"{exchange}.txt"),
-        os.path.join(COINLIST_DIR, f"{exchange.lower()}.txt"),
-        # Fallback: relative to this file
-        os.path.join(os.path.dirname(__file__), "coinlist", f"{exchange}.txt"),
-        # Another fallback
-        os.path.join(os.path.dirname(__file__), "coinlist", f"{exchange.lower()}.txt")
-    ]
-    
-    for path in possible_paths:
+    # Return a fresh list so callers can't mutate the cached symbols
+    return list(_read_symbols(exchange))
+
+
+@lru_cache(maxsize=32)
+def _read_symbols(exchange: str) -> Tuple[str, ...]:
+    """Read and parse the symbol file for an exchange (cached)."""
+    for template in _PATH_TEMPLATES:
         try:
-            if os.path.exists(path):
-                with open(path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                symbols = [line.strip() for line in content.split('\n') if line.strip()]
-                if symbols:  # Only return if we actually got symbols
-                    return symbols
+            content = Path(template.format(e=exchange, le=exchange.lower())).read_text(encoding='utf-8')
         except (FileNotFoundError, IOError, UnicodeDecodeError):
             continue
+        symbols = tuple(line.strip() for line in content.splitlines() if line.strip())
+        if symbols:  # Only return if we actually got symbols
+            return symbols
     
-    # If all fails, return empty list
-    return []
+    # If all fails, return empty
+    return ()
 
 
 def save_symbols(exchange: str, symbols: List[str]) -> bool:
@@ -71,6 +77,8 @@ def save_symbols(exchange: str, symbols: List[str]) -> bool:
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write('\n'.join(symbols))
         
+        # Drop cached symbol lists so the new file is picked up
+        _read_symbols.cache_clear()
         return True
     except (IOError, OSError) as e:
         print(f"Error saving symbols: {e}")
@@ -84,13 +92,13 @@ def list_available_exchanges() -> List[str]:
     Returns:
         List of exchange names
     """
-    if not os.path.exists(COINLIST_DIR):
+    try:
+        with os.scandir(COINLIST_DIR) as entries:
+            # Remove .txt and uppercase; files differing only in case count once
+            return sorted({
+                entry.name[:-4].upper()
+                for entry in entries
+                if entry.name.endswith('.txt') and entry.is_file()
+            })
+    except FileNotFoundError:
         return []
-    
-    exchanges = []
-    for filename in os.listdir(COINLIST_DIR):
-        if filename.endswith('.txt'):
-            exchange = filename[:-4].upper()  # Remove .txt and uppercase
-            exchanges.append(exchange)
-    
-    return sorted(exchanges)
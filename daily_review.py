@@ -8,27 +8,25 @@ NO USER INPUT REQUIRED
 import sys
 import io
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-# Set stdout to use utf-8 encoding
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+# Set stdout to use utf-8 encoding (only needed when the console uses another encoding)
+if (sys.stdout.encoding or '').lower().replace('-', '') != 'utf8':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
 sys.path.append(str(Path(__file__).parent))
 
 from paper_trading_db import PaperTradingDB
 
-# Try to import pytz, fall back to manual offset
+# Nairobi has no DST, so a fixed UTC+3 offset is used if the tz database is unavailable
 try:
-    import pytz
-    EAT = pytz.timezone('Africa/Nairobi')
-    def get_nairobi_time():
-        return datetime.now(EAT)
-except ImportError:
-    from datetime import timezone
-    EAT_OFFSET = timezone(timedelta(hours=3))
-    EAT = None
-    def get_nairobi_time():
-        return datetime.now(EAT_OFFSET)
+    EAT = ZoneInfo('Africa/Nairobi')
+except ZoneInfoNotFoundError:
+    EAT = timezone(timedelta(hours=3))
+
+def get_nairobi_time():
+    return datetime.now(EAT)
 
 def daily_review():
     """Generate daily performance review - FULLY AUTOMATED"""
@@ -41,8 +39,10 @@ def daily_review():
     print(f"Time: {now.strftime('%H:%M:%S')} EAT")
     print("="*80 + "\n")
 
-    # Get overall stats
-    stats = db.get_strategy_stats()
+    # Get overall stats, trades closed in the last 24 hours and open positions in one read
+    yesterday_utc = (now - timedelta(days=1)).astimezone(timezone.utc)
+    snapshot = db.get_daily_review_snapshot(closed_since=yesterday_utc.isoformat())
+    stats = snapshot['stats']
 
     if not stats or stats['total_trades'] == 0:
         print("No closed trades yet. Keep monitoring your open positions!\n")
@@ -65,21 +65,7 @@ def daily_review():
     print(f"Average Loss: {stats['avg_loss_percent']:.2f}%" if stats['avg_loss_percent'] else "Average Loss: N/A")
     print("-" * 80 + "\n")
 
-    # Get recent closed trades (last 24 hours)
-    recent_trades = db.get_trade_history(limit=20)
-    yesterday = now - timedelta(days=1)
-
-    today_trades = []
-    for t in recent_trades:
-        if t['exit_time']:
-            try:
-                exit_dt = datetime.fromisoformat(t['exit_time'].replace('Z', '+00:00'))
-                if EAT:
-                    exit_dt = exit_dt.astimezone(EAT)
-                if exit_dt >= yesterday:
-                    today_trades.append(t)
-            except:
-                pass
+    today_trades = snapshot['closed']
 
     if today_trades:
         print(f"TRADES CLOSED TODAY ({len(today_trades)})")
@@ -107,7 +93,7 @@ def daily_review():
         print("-" * 80 + "\n")
 
     # Get open positions
-    open_trades = db.get_open_trades()
+    open_trades = snapshot['open']
 
     print(f"OPEN POSITIONS ({len(open_trades)} trades)")
     print("-" * 80)
@@ -161,32 +147,36 @@ def save_log(now, stats, today_trades, open_trades):
 
     log_file = log_dir / f"daily-review-{now.strftime('%Y-%m-%d')}.md"
 
-    with open(log_file, 'w', encoding='utf-8') as f:
-        f.write(f"# Daily Paper Trading Review - {now.strftime('%Y-%m-%d')}\n\n")
-        f.write(f"**Generated:** {now.strftime('%Y-%m-%d %H:%M:%S')} EAT\n\n")
+    buf = []
+    buf.append(f"# Daily Paper Trading Review - {now.strftime('%Y-%m-%d')}\n\n")
+    buf.append(f"**Generated:** {now.strftime('%Y-%m-%d %H:%M:%S')} EAT\n\n")
 
-        if stats:
-            f.write("## Performance Summary\n\n")
-            f.write(f"- **Total Trades:** {stats['total_trades']}\n")
-            f.write(f"- **Win Rate:** {stats['win_rate']:.1f}%\n")
-            f.write(f"- **Total P&L:** ${stats['total_pnl_usd']:.2f} USD\n")
-            f.write(f"- **Avg P&L:** {stats['avg_pnl_percent']:.2f}%\n\n")
-        else:
-            f.write("## Performance Summary\n\n")
-            f.write("No closed trades yet.\n\n")
-
-        if today_trades:
-            f.write(f"## Trades Closed Today ({len(today_trades)})\n\n")
-            for trade in today_trades:
-                f.write(f"### {trade['symbol']} {trade['side']}\n")
-                f.write(f"- **Entry:** ${trade['entry_price_usd']:.2f}\n")
-                f.write(f"- **Exit:** ${trade['exit_price_usd']:.2f}\n")
-                f.write(f"- **P&L:** {trade['pnl_percent']:.2f}%\n")
-                f.write(f"- **Reason:** {trade['exit_reason']}\n\n")
-
-        f.write(f"## Open Positions ({len(open_trades)})\n\n")
-        for trade in open_trades:
-            f.write(f"- {trade['symbol']} {trade['side']} @ ${trade['entry_price_usd']:.2f}\n")
+    if stats:
+        buf.append("## Performance Summary\n\n")
+        buf.append(f"- **Total Trades:** {stats['total_trades']}\n")
+        buf.append(f"- **Win Rate:** {stats['win_rate']:.1f}%\n")
+        buf.append(f"- **Total P&L:** ${stats['total_pnl_usd']:.2f} USD\n")
+        buf.append(f"- **Avg P&L:** {stats['avg_pnl_percent']:.2f}%\n\n")
+    else:
+        buf.append("## Performance Summary\n\n")
+        buf.append("No closed trades yet.\n\n")
+
+    if today_trades:
+        buf.append(f"## Trades Closed Today ({len(today_trades)})\n\n")
+        for trade in today_trades:
+            buf.append(f"### {trade['symbol']} {trade['side']}\n")
+            buf.append(f"- **Entry:** ${trade['entry_price_usd']:.2f}\n")
+            buf.append(f"- **Exit:** ${trade['exit_price_usd']:.2f}\n")
+            buf.append(f"- **P&L:** {trade['pnl_percent']:.2f}%\n")
+            buf.append(f"- **Reason:** {trade['exit_reason']}\n\n")
+
+    buf.append(f"## Open Positions ({len(open_trades)})\n\n")
+    for trade in open_trades:
+        buf.append(f"- {trade['symbol']} {trade['side']} @ ${trade['entry_price_usd']:.2f}\n")
+
+    # Write the whole review in one call
+    with open(log_file, 'w', encoding='utf-8', buffering=64 * 1024) as f:
+        f.write(''.join(buf))
 
     print(f"Daily review saved to: {log_file}")
 
@@ -4,20 +4,67 @@ Demonstrates how to fetch data from TradingView and analyze with trading_metrics
 """
 
 import logging
+import sys
+import traceback
+
+import numpy as np
+
 from tradingview_screener import (
     fetch_screener_indicators,
     fetch_screener_multi_changes,
     map_to_trading_metrics_format,
 )
-from trading_metrics import compute_metrics
+from trading_constants import RATING_MIN, RATING_SIGNALS
+from trading_metrics import INDICATOR_KEYS, compute_metrics, compute_metrics_batch
 from trading_utils import get_full_analysis, setup_logging
 
+# Opportunities listed on each side of the exchange scan
+TOP_K = 5
+
+# Section rules used in the example output
+SEPARATOR = "=" * 60
+SUB_SEPARATOR = "-" * 60
+
+
+def _top_k(idx, ratings, k):
+    """First k of idx by ascending rating, ties in index order, without a full sort"""
+    if len(idx) == 0:
+        return idx
+    # idx is ascending, so rating * n + position is a unique, tie-stable key
+    key = ratings[idx].astype(np.int64) * len(idx) + np.arange(len(idx))
+    if len(idx) > k:
+        part = np.argpartition(key, k - 1)[:k]
+        return idx[part[np.argsort(key[part])]]
+    return idx[np.argsort(key)]
+
+
+def _scan_rows(formatted_rows, columns, batch, idx):
+    """Build display rows for the selected scan indices"""
+    rows = []
+    for i in idx.tolist():
+        rating = int(batch['composite_rating'][i])
+        rows.append({
+            'symbol': formatted_rows[i][0],
+            'signal': RATING_SIGNALS[rating - RATING_MIN],
+            'rating': rating,
+            'price': round(float(columns['close'][i]), 4),
+            'change': round(float(batch['change'][i]), 3),
+            'trend_strength': round(float(batch['trend_strength'][i]), 2),
+        })
+    return rows
+
+
+def _write_lines(lines):
+    """Write collected output lines to stdout in a single call"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 
 def example_fetch_single_symbols():
     """Example: Fetch specific symbols and analyze"""
-    print("\n" + "=" * 60)
-    print("EXAMPLE 1: Fetch Specific Symbols")
-    print("=" * 60)
+    buf = []
+    buf.append("\n" + SEPARATOR)
+    buf.append("EXAMPLE 1: Fetch Specific Symbols")
+    buf.append(SEPARATOR)
     
     symbols = [
         'BINANCE:BTCUSDT',
@@ -25,7 +72,7 @@ def example_fetch_single_symbols():
         'BINANCE:BNBUSDT',
     ]
     
-    print(f"\nFetching indicators for {len(symbols)} symbols...")
+    buf.append(f"\nFetching indicators for {len(symbols)} symbols...")
     
     try:
         data = fetch_screener_indicators(
@@ -36,16 +83,16 @@ def example_fetch_single_symbols():
             validate_data=True,
         )
         
-        print(f"✅ Fetched data for {len(data)} symbols\n")
+        buf.append(f"✅ Fetched data for {len(data)} symbols\n")
         
         # Analyze each symbol
         for item in data:
             symbol = item['symbol']
             indicators = item['indicators']
             
-            print(f"\n{'='*60}")
-            print(f"Analyzing: {symbol}")
-            print(f"{'='*60}")
+            buf.append("\n" + SEPARATOR)
+            buf.append(f"Analyzing: {symbol}")
+            buf.append(SEPARATOR)
             
             # Map to trading metrics format
             formatted = map_to_trading_metrics_format(indicators)
@@ -60,26 +107,29 @@ def example_fetch_single_symbols():
                     price = metrics['price']
                     change = metrics['change']
                     
-                    print(f"Price: ${price} ({change:+.2f}%)")
-                    print(f"Signal: {signal} (Rating: {rating})")
-                    print(f"Trend Strength: {metrics['composite']['trend_strength']}")
+                    buf.append(f"Price: ${price} ({change:+.2f}%)")
+                    buf.append(f"Signal: {signal} (Rating: {rating})")
+                    buf.append(f"Trend Strength: {metrics['composite']['trend_strength']}")
                 else:
-                    print(f"❌ Failed to compute metrics for {symbol}")
+                    buf.append(f"❌ Failed to compute metrics for {symbol}")
             else:
-                print(f"⚠️ Incomplete indicator data for {symbol}")
-                print(f"Available indicators: {list(indicators.keys())}")
+                buf.append(f"⚠️ Incomplete indicator data for {symbol}")
+                buf.append(f"Available indicators: {list(indicators.keys())}")
     
     except Exception as e:
-        print(f"❌ Error: {e}")
+        buf.append(f"❌ Error: {e}")
+    finally:
+        _write_lines(buf)
 
 
 def example_scan_exchange():
     """Example: Scan entire exchange for opportunities"""
-    print("\n" + "=" * 60)
-    print("EXAMPLE 2: Scan Exchange for Top Opportunities")
-    print("=" * 60)
+    buf = []
+    buf.append("\n" + SEPARATOR)
+    buf.append("EXAMPLE 2: Scan Exchange for Top Opportunities")
+    buf.append(SEPARATOR)
     
-    print("\nScanning Binance for top 20 pairs...")
+    buf.append("\nScanning Binance for top 20 pairs...")
     
     try:
         data = fetch_screener_indicators(
@@ -91,73 +141,73 @@ def example_scan_exchange():
             validate_data=True,
         )
         
-        print(f"✅ Fetched data for {len(data)} symbols\n")
+        buf.append(f"✅ Fetched data for {len(data)} symbols\n")
         
         # Analyze and rank by signal strength
-        results = []
-        
+        formatted_rows = []
         for item in data:
-            symbol = item['symbol']
-            indicators = item['indicators']
-            
-            formatted = map_to_trading_metrics_format(indicators)
-            if not formatted:
-                continue
-            
-            metrics = compute_metrics(formatted)
-            if not metrics:
-                continue
-            
-            results.append({
-                'symbol': symbol,
-                'signal': metrics['composite']['signal'],
-                'rating': metrics['composite']['rating'],
-                'price': metrics['price'],
-                'change': metrics['change'],
-                'trend_strength': metrics['composite']['trend_strength'],
-            })
+            formatted = map_to_trading_metrics_format(item['indicators'])
+            if formatted:
+                formatted_rows.append((item['symbol'], formatted))
+        
+        # Score all symbols in one vectorized call (one array per indicator)
+        n = len(formatted_rows)
+        columns = {
+            key: np.fromiter(
+                (np.nan if f[key] is None else f[key] for _, f in formatted_rows),
+                dtype=np.float64, count=n,
+            )
+            for key in INDICATOR_KEYS
+        }
+        batch = compute_metrics_batch(columns)
         
-        # Sort by rating (most bullish first)
-        results.sort(key=lambda x: x['rating'])
+        # Rank by rating (most bullish first); ties keep fetch order
+        valid_idx = np.flatnonzero(batch['valid'])
+        ratings = batch['composite_rating'][valid_idx]
+        bullish = _scan_rows(formatted_rows, columns, batch,
+                             _top_k(valid_idx[ratings <= -2], batch['composite_rating'], TOP_K))
+        bearish = _scan_rows(formatted_rows, columns, batch,
+                             _top_k(valid_idx[ratings >= 2], batch['composite_rating'], TOP_K))
         
         # Display top opportunities
-        print("\n🟢 TOP BULLISH OPPORTUNITIES:")
-        print("-" * 60)
-        bullish = [r for r in results if r['rating'] <= -2][:5]
+        buf.append("\n🟢 TOP BULLISH OPPORTUNITIES:")
+        buf.append(SUB_SEPARATOR)
         if bullish:
             for r in bullish:
-                print(f"{r['symbol']:25} | Signal: {r['signal']:12} | "
+                buf.append(f"{r['symbol']:25} | Signal: {r['signal']:12} | "
                       f"Rating: {r['rating']:2} | Price: ${r['price']:.4f} | "
                       f"Change: {r['change']:+.2f}%")
         else:
-            print("No strong bullish signals found")
+            buf.append("No strong bullish signals found")
         
-        print("\n🔴 TOP BEARISH OPPORTUNITIES:")
-        print("-" * 60)
-        bearish = [r for r in results if r['rating'] >= 2][:5]
+        buf.append("\n🔴 TOP BEARISH OPPORTUNITIES:")
+        buf.append(SUB_SEPARATOR)
         if bearish:
             for r in bearish:
-                print(f"{r['symbol']:25} | Signal: {r['signal']:12} | "
+                buf.append(f"{r['symbol']:25} | Signal: {r['signal']:12} | "
                       f"Rating: {r['rating']:2} | Price: ${r['price']:.4f} | "
                       f"Change: {r['change']:+.2f}%")
         else:
-            print("No strong bearish signals found")
+            buf.append("No strong bearish signals found")
     
     except Exception as e:
-        print(f"❌ Error: {e}")
+        buf.append(f"❌ Error: {e}")
+    finally:
+        _write_lines(buf)
 
 
 def example_multi_timeframe():
     """Example: Multi-timeframe analysis"""
-    print("\n" + "=" * 60)
-    print("EXAMPLE 3: Multi-Timeframe Analysis")
-    print("=" * 60)
+    buf = []
+    buf.append("\n" + SEPARATOR)
+    buf.append("EXAMPLE 3: Multi-Timeframe Analysis")
+    buf.append(SEPARATOR)
     
     symbols = ['BINANCE:BTCUSDT', 'BINANCE:ETHUSDT']
     timeframes = ['15m', '1h', '4h', '1D']
     
-    print(f"\nFetching multi-timeframe data for {len(symbols)} symbols...")
-    print(f"Timeframes: {', '.join(timeframes)}\n")
+    buf.append(f"\nFetching multi-timeframe data for {len(symbols)} symbols...")
+    buf.append(f"Timeframes: {', '.join(timeframes)}\n")
     
     try:
         data = fetch_screener_multi_changes(
@@ -173,56 +223,63 @@ def example_multi_timeframe():
             changes = item['changes']
             base_indicators = item['base_indicators']
             
-            print(f"\n{'='*60}")
-            print(f"{symbol}")
-            print(f"{'='*60}")
+            buf.append("\n" + SEPARATOR)
+            buf.append(f"{symbol}")
+            buf.append(SEPARATOR)
             
             # Display changes across timeframes
-            print("\n📊 Price Changes:")
+            buf.append("\n📊 Price Changes:")
             for tf in timeframes:
                 change = changes.get(tf)
                 if change is not None:
                     emoji = "🟢" if change > 0 else "🔴" if change < 0 else "⚪"
-                    print(f"  {tf:4} : {emoji} {change:+.2f}%")
+                    buf.append(f"  {tf:4} : {emoji} {change:+.2f}%")
                 else:
-                    print(f"  {tf:4} : ⚠️ No data")
+                    buf.append(f"  {tf:4} : ⚠️ No data")
             
             # Analyze base timeframe
-            print(f"\n📈 Base Timeframe (4h) Analysis:")
-            print(f"  Price: ${base_indicators['close']:.4f}")
-            print(f"  BB Upper: ${base_indicators['BB.upper']:.4f}")
-            print(f"  BB Middle: ${base_indicators['SMA20']:.4f}")
-            print(f"  BB Lower: ${base_indicators['BB.lower']:.4f}")
-            print(f"  Volume: {base_indicators['volume']:,.0f}")
+            buf.append(f"\n📈 Base Timeframe (4h) Analysis:")
+            buf.append(f"  Price: ${base_indicators['close']:.4f}")
+            buf.append(f"  BB Upper: ${base_indicators['BB.upper']:.4f}")
+            buf.append(f"  BB Middle: ${base_indicators['SMA20']:.4f}")
+            buf.append(f"  BB Lower: ${base_indicators['BB.lower']:.4f}")
+            buf.append(f"  Volume: {base_indicators['volume']:,.0f}")
             
             # Determine trend alignment
-            bullish_tfs = sum(1 for c in changes.values() if c and c > 0)
-            bearish_tfs = sum(1 for c in changes.values() if c and c < 0)
+            vals = np.fromiter(
+                (np.nan if c is None else c for c in changes.values()),
+                dtype=np.float64, count=len(changes),
+            )
+            bullish_tfs = int((vals > 0).sum())
+            bearish_tfs = int((vals < 0).sum())
             
-            print(f"\n🎯 Trend Alignment:")
-            print(f"  Bullish timeframes: {bullish_tfs}/{len(timeframes)}")
-            print(f"  Bearish timeframes: {bearish_tfs}/{len(timeframes)}")
+            buf.append(f"\n🎯 Trend Alignment:")
+            buf.append(f"  Bullish timeframes: {bullish_tfs}/{len(timeframes)}")
+            buf.append(f"  Bearish timeframes: {bearish_tfs}/{len(timeframes)}")
             
             if bullish_tfs >= 3:
-                print(f"  ✅ Strong bullish alignment")
+                buf.append(f"  ✅ Strong bullish alignment")
             elif bearish_tfs >= 3:
-                print(f"  ⚠️ Strong bearish alignment")
+                buf.append(f"  ⚠️ Strong bearish alignment")
             else:
-                print(f"  ➡️ Mixed signals")
+                buf.append(f"  ➡️ Mixed signals")
     
     except Exception as e:
-        print(f"❌ Error: {e}")
+        buf.append(f"❌ Error: {e}")
+    finally:
+        _write_lines(buf)
 
 
 def example_full_analysis():
     """Example: Complete analysis with detailed output"""
-    print("\n" + "=" * 60)
-    print("EXAMPLE 4: Full Detailed Analysis")
-    print("=" * 60)
+    buf = []
+    buf.append("\n" + SEPARATOR)
+    buf.append("EXAMPLE 4: Full Detailed Analysis")
+    buf.append(SEPARATOR)
     
     symbol = 'BINANCE:BTCUSDT'
     
-    print(f"\nFetching complete analysis for {symbol}...\n")
+    buf.append(f"\nFetching complete analysis for {symbol}...\n")
     
     try:
         data = fetch_screener_indicators(
@@ -234,7 +291,7 @@ def example_full_analysis():
         )
         
         if not data:
-            print(f"❌ No data returned for {symbol}")
+            buf.append(f"❌ No data returned for {symbol}")
             return
         
         item = data[0]
@@ -244,8 +301,8 @@ def example_full_analysis():
         formatted = map_to_trading_metrics_format(indicators)
         
         if not formatted:
-            print(f"⚠️ Incomplete indicator data")
-            print(f"Available: {list(indicators.keys())}")
+            buf.append(f"⚠️ Incomplete indicator data")
+            buf.append(f"Available: {list(indicators.keys())}")
             return
         
         # Compute metrics
@@ -253,12 +310,14 @@ def example_full_analysis():
         
         if metrics:
             # Display full analysis
-            print(get_full_analysis(metrics))
+            buf.append(get_full_analysis(metrics))
         else:
-            print(f"❌ Failed to compute metrics")
+            buf.append(f"❌ Failed to compute metrics")
     
     except Exception as e:
-        print(f"❌ Error: {e}")
+        buf.append(f"❌ Error: {e}")
+    finally:
+        _write_lines(buf)
 
 
 def main():
@@ -266,9 +325,9 @@ def main():
     # Setup logging
     setup_logging(level=logging.INFO)
     
-    print("\n" + "=" * 60)
+    print("\n" + SEPARATOR)
     print("TRADINGVIEW SCREENER + TRADING METRICS INTEGRATION")
-    print("=" * 60)
+    print(SEPARATOR)
     print("\n⚠️ IMPORTANT NOTES:")
     print("  • Extended indicators (MACD, StochRSI, ADX, CCI) require")
     print("    verification of TradingView column names")
@@ -288,12 +347,11 @@ def main():
         print("\n\n⚠️ Interrupted by user")
     except Exception as e:
         print(f"\n\n❌ Unexpected error: {e}")
-        import traceback
         traceback.print_exc()
     
-    print("\n" + "=" * 60)
+    print("\n" + SEPARATOR)
     print("EXAMPLES COMPLETE")
-    print("=" * 60)
+    print(SEPARATOR)
     print("\n💡 Next Steps:")
     print("  1. Verify TradingView column names for extended indicators")
     print("  2. Update EXTENDED_INDICATORS in tradingview_screener.py")
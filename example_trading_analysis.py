@@ -7,13 +7,24 @@ from trading_metrics import compute_metrics
 from trading_utils import get_full_analysis, setup_logging
 from trading_constants import DEFAULT_WEIGHTS
 import logging
+import sys
+
+# Section rules used in the example output
+SEPARATOR = "=" * 60
+SUB_SEPARATOR = "-" * 60
+
+
+def _write_lines(lines):
+    """Write collected output lines to stdout in a single call"""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def example_bullish_scenario():
     """Example with bullish indicators"""
-    print("\n" + "=" * 60)
-    print("EXAMPLE 1: BULLISH SCENARIO")
-    print("=" * 60)
+    buf = []
+    buf.append("\n" + SEPARATOR)
+    buf.append("EXAMPLE 1: BULLISH SCENARIO")
+    buf.append(SEPARATOR)
     
     indicators = {
         # Price data
@@ -45,16 +56,19 @@ def example_bullish_scenario():
     
     result = compute_metrics(indicators)
     if result:
-        print(get_full_analysis(result))
+        buf.append(get_full_analysis(result))
     else:
-        print("❌ Failed to compute metrics")
+        buf.append("❌ Failed to compute metrics")
+    
+    _write_lines(buf)
 
 
 def example_bearish_scenario():
     """Example with bearish indicators"""
-    print("\n" + "=" * 60)
-    print("EXAMPLE 2: BEARISH SCENARIO")
-    print("=" * 60)
+    buf = []
+    buf.append("\n" + SEPARATOR)
+    buf.append("EXAMPLE 2: BEARISH SCENARIO")
+    buf.append(SEPARATOR)
     
     indicators = {
         # Price data
@@ -86,16 +100,19 @@ def example_bearish_scenario():
     
     result = compute_metrics(indicators)
     if result:
-        print(get_full_analysis(result))
+        buf.append(get_full_analysis(result))
     else:
-        print("❌ Failed to compute metrics")
+        buf.append("❌ Failed to compute metrics")
+    
+    _write_lines(buf)
 
 
 def example_neutral_scenario():
     """Example with mixed/neutral indicators"""
-    print("\n" + "=" * 60)
-    print("EXAMPLE 3: NEUTRAL/MIXED SCENARIO")
-    print("=" * 60)
+    buf = []
+    buf.append("\n" + SEPARATOR)
+    buf.append("EXAMPLE 3: NEUTRAL/MIXED SCENARIO")
+    buf.append(SEPARATOR)
     
     indicators = {
         # Price data
@@ -127,16 +144,19 @@ def example_neutral_scenario():
     
     result = compute_metrics(indicators)
     if result:
-        print(get_full_analysis(result))
+        buf.append(get_full_analysis(result))
     else:
-        print("❌ Failed to compute metrics")
+        buf.append("❌ Failed to compute metrics")
+    
+    _write_lines(buf)
 
 
 def example_custom_weights():
     """Example with custom indicator weights"""
-    print("\n" + "=" * 60)
-    print("EXAMPLE 4: CUSTOM WEIGHTS (Emphasize MACD & StochRSI)")
-    print("=" * 60)
+    buf = []
+    buf.append("\n" + SEPARATOR)
+    buf.append("EXAMPLE 4: CUSTOM WEIGHTS (Emphasize MACD & StochRSI)")
+    buf.append(SEPARATOR)
     
     indicators = {
         "open": 100.0,
@@ -164,22 +184,25 @@ def example_custom_weights():
         "cci": 0.9,
     }
     
-    print("\nUsing custom weights:")
+    buf.append("\nUsing custom weights:")
     for indicator, weight in custom_weights.items():
-        print(f"  {indicator}: {weight}")
+        buf.append(f"  {indicator}: {weight}")
     
     result = compute_metrics(indicators, weights=custom_weights)
     if result:
-        print(get_full_analysis(result))
+        buf.append(get_full_analysis(result))
     else:
-        print("❌ Failed to compute metrics")
+        buf.append("❌ Failed to compute metrics")
+    
+    _write_lines(buf)
 
 
 def example_validation_error():
     """Example showing validation catching invalid data"""
-    print("\n" + "=" * 60)
-    print("EXAMPLE 5: VALIDATION ERROR HANDLING")
-    print("=" * 60)
+    buf = []
+    buf.append("\n" + SEPARATOR)
+    buf.append("EXAMPLE 5: VALIDATION ERROR HANDLING")
+    buf.append(SEPARATOR)
     
     # Invalid data - StochRSI out of range
     invalid_indicators = {
@@ -199,13 +222,15 @@ def example_validation_error():
         "CCI": -50.0,
     }
     
-    print("\nAttempting to compute metrics with invalid StochRSI.K = 150.0...")
+    buf.append("\nAttempting to compute metrics with invalid StochRSI.K = 150.0...")
     result = compute_metrics(invalid_indicators)
     if result:
-        print("✅ Metrics computed (unexpected)")
+        buf.append("✅ Metrics computed (unexpected)")
     else:
-        print("❌ Validation correctly rejected invalid data")
-        print("Check logs for error details")
+        buf.append("❌ Validation correctly rejected invalid data")
+        buf.append("Check logs for error details")
+    
+    _write_lines(buf)
 
 
 def main():
@@ -213,9 +238,9 @@ def main():
     # Setup logging
     setup_logging(level=logging.INFO)
     
-    print("\n" + "=" * 60)
+    print("\n" + SEPARATOR)
     print("TRADING METRICS SYSTEM - EXAMPLES")
-    print("=" * 60)
+    print(SEPARATOR)
     print("\nThis script demonstrates the trading analysis system")
     print("with various market scenarios.\n")
     
@@ -226,9 +251,9 @@ def main():
     example_custom_weights()
     example_validation_error()
     
-    print("\n" + "=" * 60)
+    print("\n" + SEPARATOR)
     print("EXAMPLES COMPLETE")
-    print("=" * 60)
+    print(SEPARATOR)
     print("\n💡 Tips:")
     print("  • Adjust weights in trading_constants.py to tune the system")
     print("  • All thresholds are configurable in trading_constants.py")
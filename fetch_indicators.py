@@ -3,8 +3,15 @@ Quick script to fetch TradingView indicators for remaining major cryptocurrencie
 """
 import json
 import logging
+import sys
 from tradingview_screener_local import fetch_screener_indicators
 
+# orjson is optional; falls back to stdlib json for the results dump
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
@@ -25,7 +32,7 @@ def main():
 
     for symbol in COINS:
         coin_name = symbol.split(':')[1]
-        logger.info(f"\nFetching indicators for {coin_name}...")
+        logger.info("\nFetching indicators for %s...", coin_name)
 
         try:
             # Fetch data
@@ -44,16 +51,16 @@ def main():
                     'symbol': symbol,
                     'indicators': indicators
                 }
-                logger.info(f"✓ Successfully fetched {coin_name}")
-                logger.info(f"  Close: ${indicators.get('close', 'N/A')}")
-                logger.info(f"  RSI: {indicators.get('RSI', 'N/A')}")
+                logger.info("✓ Successfully fetched %s", coin_name)
+                logger.info("  Close: $%s", indicators.get('close', 'N/A'))
+                logger.info("  RSI: %s", indicators.get('RSI', 'N/A'))
             else:
                 results[coin_name] = {
                     'success': False,
                     'symbol': symbol,
                     'error': 'No data returned'
                 }
-                logger.warning(f"✗ No data for {coin_name}")
+                logger.warning("✗ No data for %s", coin_name)
 
         except Exception as e:
             results[coin_name] = {
@@ -61,7 +68,7 @@ def main():
                 'symbol': symbol,
                 'error': str(e)
             }
-            logger.error(f"✗ Error fetching {coin_name}: {e}")
+            logger.error("✗ Error fetching %s: %s", coin_name, e)
 
     # Print summary
     print("\n" + "="*80)
@@ -75,7 +82,14 @@ def main():
     print("\n" + "="*80)
     print("FULL RESULTS (JSON)")
     print("="*80 + "\n")
-    print(json.dumps(results, indent=2, default=str))
+    if orjson is not None and hasattr(sys.stdout, 'buffer'):
+        sys.stdout.flush()
+        sys.stdout.buffer.write(
+            orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY, default=str) + b"\n"
+        )
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(results, indent=2, default=str))
 
     return results
 
@@ -7,8 +7,8 @@ Works independently of MCP servers.
 
 import os
 import logging
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
-from decimal import Decimal
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +21,29 @@ except ImportError:
     BINANCE_AVAILABLE = False
     logger.warning("python-binance not installed. Install with: pip install python-binance")
 
+# 24h stats output keys and the Binance ticker fields they are parsed from
+STATS_KEYS = ('price', 'price_change', 'price_change_percent', 'high', 'low', 'volume', 'quote_volume')
+STATS_FIELDS = ('lastPrice', 'priceChange', 'priceChangePercent', 'highPrice', 'lowPrice', 'volume', 'quoteVolume')
+
+# Request options passed to every Client
+CLIENT_REQUESTS_PARAMS = {"timeout": 10}
+
+# Unauthenticated client shared by all instances for public endpoints
+_public_client = None
+
+
+def _get_public_client() -> "Client":
+    """
+    Get the shared unauthenticated client, creating it on first use.
+    
+    Returns:
+        Client usable for public market-data endpoints
+    """
+    global _public_client
+    if _public_client is None:
+        _public_client = Client("", "", requests_params=CLIENT_REQUESTS_PARAMS)
+    return _public_client
+
 
 class BinanceIntegration:
     """
@@ -50,7 +73,11 @@ class BinanceIntegration:
             logger.warning("Binance API credentials not provided. Some functions will not work.")
             self.client = None
         else:
-            self.client = Client(self.api_key, self.api_secret)
+            self.client = Client(self.api_key, self.api_secret, requests_params=CLIENT_REQUESTS_PARAMS)
+    
+    def _market_client(self) -> "Client":
+        """Client for public market data: the authenticated one if available, else the shared one."""
+        return self.client or _get_public_client()
     
     def get_account_balance(self) -> Dict[str, float]:
         """
@@ -81,7 +108,7 @@ class BinanceIntegration:
             
             return balances
         except BinanceAPIException as e:
-            logger.error(f"Binance API error: {e}")
+            logger.error("Binance API error: %s", e)
             return {}
     
     def get_current_price(self, symbol: str) -> Optional[float]:
@@ -94,15 +121,14 @@ class BinanceIntegration:
         Returns:
             Current price or None if error
         """
-        if not self.client:
-            # Can get price without authentication
-            self.client = Client("", "")
+        # Can get price without authentication
+        client = self._market_client()
         
         try:
-            ticker = self.client.get_symbol_ticker(symbol=symbol)
+            ticker = client.get_symbol_ticker(symbol=symbol)
             return float(ticker['price'])
         except BinanceAPIException as e:
-            logger.error(f"Error fetching price for {symbol}: {e}")
+            logger.error("Error fetching price for %s: %s", symbol, e)
             return None
     
     def get_24h_stats(self, symbol: str) -> Optional[Dict]:
@@ -115,23 +141,15 @@ class BinanceIntegration:
         Returns:
             Dictionary with 24h stats or None if error
         """
-        if not self.client:
-            self.client = Client("", "")
+        client = self._market_client()
         
         try:
-            stats = self.client.get_ticker(symbol=symbol)
-            return {
-                'symbol': stats['symbol'],
-                'price': float(stats['lastPrice']),
-                'price_change': float(stats['priceChange']),
-                'price_change_percent': float(stats['priceChangePercent']),
-                'high': float(stats['highPrice']),
-                'low': float(stats['lowPrice']),
-                'volume': float(stats['volume']),
-                'quote_volume': float(stats['quoteVolume']),
-            }
+            stats = client.get_ticker(symbol=symbol)
+            result = {'symbol': stats['symbol']}
+            result.update(zip(STATS_KEYS, map(float, [stats[field] for field in STATS_FIELDS])))
+            return result
         except BinanceAPIException as e:
-            logger.error(f"Error fetching stats for {symbol}: {e}")
+            logger.error("Error fetching stats for %s: %s", symbol, e)
             return None
     
     def get_order_book(self, symbol: str, limit: int = 10) -> Optional[Dict]:
@@ -145,17 +163,16 @@ class BinanceIntegration:
         Returns:
             Dictionary with bids and asks or None if error
         """
-        if not self.client:
-            self.client = Client("", "")
+        client = self._market_client()
         
         try:
-            depth = self.client.get_order_book(symbol=symbol, limit=limit)
+            depth = client.get_order_book(symbol=symbol, limit=limit)
             return {
                 'bids': [[float(price), float(qty)] for price, qty in depth['bids']],
                 'asks': [[float(price), float(qty)] for price, qty in depth['asks']],
             }
         except BinanceAPIException as e:
-            logger.error(f"Error fetching order book for {symbol}: {e}")
+            logger.error("Error fetching order book for %s: %s", symbol, e)
             return None
     
     def place_test_order(self, symbol: str, side: str, quantity: float, order_type: str = "MARKET") -> bool:
@@ -186,13 +203,14 @@ class BinanceIntegration:
                 logger.warning("LIMIT orders require price parameter")
                 return False
             
-            logger.info(f"Test order successful: {side} {quantity} {symbol}")
+            logger.info("Test order successful: %s %s %s", side, quantity, symbol)
             return True
         except BinanceAPIException as e:
-            logger.error(f"Test order failed: {e}")
+            logger.error("Test order failed: %s", e)
             return False
 
 
+@lru_cache(maxsize=4096)
 def normalize_symbol(symbol: str) -> str:
     """
     Normalize symbol from TradingView format to Binance format.
@@ -212,19 +230,28 @@ def get_binance_prices(symbols: List[str]) -> Dict[str, float]:
     """
     Get current prices for multiple symbols.
     
+    Fetches all tickers in a single request instead of one request per symbol.
+    
     Args:
         symbols: List of symbols (can be in TradingView or Binance format)
         
     Returns:
         Dictionary of {symbol: price}
     """
-    binance = BinanceIntegration()
-    prices = {}
+    if not BINANCE_AVAILABLE:
+        raise ImportError("python-binance not installed. Run: pip install python-binance")
+    
+    try:
+        tickers = _get_public_client().get_all_tickers()
+    except BinanceAPIException as e:
+        logger.error("Error fetching prices: %s", e)
+        return {}
     
-    for symbol in symbols:
-        normalized = normalize_symbol(symbol)
-        price = binance.get_current_price(normalized)
-        if price:
-            prices[symbol] = price
+    wanted = {normalize_symbol(symbol) for symbol in symbols}
+    lookup = {t['symbol']: float(t['price']) for t in tickers if t['symbol'] in wanted}
     
-    return prices
+    return {
+        symbol: lookup[normalize_symbol(symbol)]
+        for symbol in symbols
+        if lookup.get(normalize_symbol(symbol))
+    }
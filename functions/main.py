@@ -1,7 +1,11 @@
 import logging
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 import firebase_admin
 from firebase_admin import credentials, firestore
 from google.cloud import functions_framework
@@ -48,35 +52,97 @@ MAJOR_COINS = [
     "BINANCE:DOGEUSDT"
 ]
 
+# Hashable, order-preserving form of MAJOR_COINS used as the fetch cache key
+MAJOR_COINS_KEY = tuple(MAJOR_COINS)
+
+# Warm containers reuse fetched data for scheduler fires within this window (seconds)
+FETCH_CACHE_TTL = 240
+
+# Set ANALYSIS_BYPASS_CACHE=1 to always fetch fresh data (e.g. for manual runs)
+BYPASS_CACHE_ENV = "ANALYSIS_BYPASS_CACHE"
+
+
+class _EmptyFetch(Exception):
+    """Raised inside the fetch caches so empty responses are not memoized"""
+
+
+@lru_cache(maxsize=4)
+def _cached_trading_signals(exchange, symbols, timeframe, ttl_bucket):
+    """get_trading_signals memoized per TTL window; ttl_bucket only varies the cache key"""
+    results = get_trading_signals(exchange=exchange, symbols=list(symbols), timeframe=timeframe)
+    if not results:
+        raise _EmptyFetch("no trading signals")
+    return tuple(results)
+
+
+@lru_cache(maxsize=4)
+def _cached_binance_prices(symbols, ttl_bucket):
+    """get_binance_prices memoized per TTL window; ttl_bucket only varies the cache key"""
+    prices = get_binance_prices(list(symbols))
+    if not prices:
+        raise _EmptyFetch("no prices")
+    return MappingProxyType(prices)
+
+
+def _ttl_bucket():
+    """Current cache window, or None to bypass the cache"""
+    if os.environ.get(BYPASS_CACHE_ENV) == "1":
+        return None
+    return int(time.time() // FETCH_CACHE_TTL)
+
+
+def _fetch_signals(bucket):
+    """Fetch trading signals for the majors, through the TTL cache unless bypassed"""
+    if bucket is None:
+        return get_trading_signals(
+            exchange="BINANCE",
+            symbols=MAJOR_COINS,
+            timeframe="4h"
+        )
+    try:
+        cached = _cached_trading_signals("BINANCE", MAJOR_COINS_KEY, "4h", bucket)
+    except _EmptyFetch:
+        return []
+    # Copy so callers never mutate the results shared through the cache
+    return [dict(result) for result in cached]
+
+
+def _fetch_prices(bucket):
+    """Fetch live Binance prices for the majors, through the TTL cache unless bypassed"""
+    if bucket is None:
+        return get_binance_prices(MAJOR_COINS)
+    try:
+        return dict(_cached_binance_prices(MAJOR_COINS_KEY, bucket))
+    except _EmptyFetch:
+        return {}
+
+
 @functions_framework.cloud_event
 def scheduled_analysis(cloud_event):
     """
     Triggered by a schedule (e.g., EventArc or Cloud Scheduler).
     Runs the majors analysis and saves the report to Firestore.
     """
-    logger.info(f"Starting scheduled analysis at {datetime.now()}")
+    logger.info("Starting scheduled analysis at %s", datetime.now())
     
     try:
-        # 1. Get Trading Signals
-        logger.info("Fetching trading signals...")
-        results = get_trading_signals(
-            exchange="BINANCE",
-            symbols=MAJOR_COINS,
-            timeframe="4h"
-        )
+        # 1. Get Trading Signals and 2. Live Prices (for accuracy), fetched concurrently
+        logger.info("Fetching trading signals and live prices...")
+        bucket = _ttl_bucket()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            signals_future = executor.submit(_fetch_signals, bucket)
+            prices_future = executor.submit(_fetch_prices, bucket)
+            results = signals_future.result()
+            try:
+                prices = prices_future.result()
+            except Exception as e:
+                logger.warning("Could not fetch live prices: %s. Using screener prices.", e)
+                prices = {}
         
         if not results:
             logger.error("No results returned from screener.")
             return "Analysis failed: No results"
 
-        # 2. Get Live Prices (for accuracy)
-        logger.info("Fetching live prices...")
-        try:
-            prices = get_binance_prices(MAJOR_COINS)
-        except Exception as e:
-            logger.warning(f"Could not fetch live prices: {e}. Using screener prices.")
-            prices = {}
-
         # 3. Generate Report
         logger.info("Generating report...")
         report_markdown = generate_majors_report(results, prices)
@@ -91,9 +157,9 @@ def scheduled_analysis(cloud_event):
             "status": "completed"
         })
         
-        logger.info(f"Analysis completed and saved to document {doc_ref.id}")
+        logger.info("Analysis completed and saved to document %s", doc_ref.id)
         return f"Success: {doc_ref.id}"
 
     except Exception as e:
-        logger.exception(f"Error during analysis: {e}")
+        logger.exception("Error during analysis: %s", e)
         return f"Error: {e}"
@@ -3,7 +3,7 @@ Trading Constants and Thresholds
 All magic numbers extracted to constants for easy tuning and maintenance.
 """
 
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class Signal(str, Enum):
@@ -15,6 +15,29 @@ class Signal(str, Enum):
     STRONG_SELL = "STRONG_SELL"
 
 
+class SignalLevel(IntEnum):
+    """Signal strength ranking (higher is more bullish); names match Signal"""
+    STRONG_SELL = 0
+    SELL = 1
+    NEUTRAL = 2
+    BUY = 3
+    STRONG_BUY = 4
+
+
+# Signal for each rating, indexed by rating - RATING_MIN (see RATING SCALE).
+# Composite and MACD treat +/-1 as a lean; the other indicators need +/-2.
+RATING_SIGNALS = (
+    Signal.STRONG_BUY.value, Signal.BUY.value, Signal.BUY.value,
+    Signal.NEUTRAL.value,
+    Signal.SELL.value, Signal.SELL.value, Signal.STRONG_SELL.value,
+)
+STRICT_RATING_SIGNALS = (
+    Signal.STRONG_BUY.value, Signal.BUY.value, Signal.NEUTRAL.value,
+    Signal.NEUTRAL.value,
+    Signal.NEUTRAL.value, Signal.SELL.value, Signal.STRONG_SELL.value,
+)
+
+
 # ==================== STOCHASTIC RSI THRESHOLDS ====================
 STOCH_OVERSOLD = 20.0
 STOCH_EXTREMELY_OVERSOLD = 10.0
@@ -39,6 +62,10 @@ ADX_TREND_THRESHOLD = 25.0
 ADX_STRONG_TREND = 40.0
 ADX_VERY_STRONG_TREND = 50.0
 
+# Trend strength by number of thresholds ADX strictly exceeds (bisect_left)
+ADX_TREND_LEVELS = (ADX_WEAK_TREND, ADX_TREND_THRESHOLD, ADX_STRONG_TREND, ADX_VERY_STRONG_TREND)
+ADX_TREND_STRENGTHS = (0.2, 0.4, 0.7, 0.85, 1.0)
+
 # Valid range for ADX
 ADX_MIN = 0.0
 ADX_MAX = 100.0
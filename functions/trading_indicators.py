@@ -6,18 +6,20 @@ All thresholds are imported from trading_constants.py for easy tuning.
 
 from __future__ import annotations
 from typing import Tuple, Optional
+from bisect import bisect_left
 import logging
 
 from trading_constants import (
-    Signal,
     STOCH_OVERSOLD, STOCH_EXTREMELY_OVERSOLD,
     STOCH_OVERBOUGHT, STOCH_EXTREMELY_OVERBOUGHT, STOCH_MIDPOINT,
     MACD_HIST_MODERATE, MACD_HIST_STRONG, MACD_ZERO_LINE,
-    ADX_WEAK_TREND, ADX_TREND_THRESHOLD, ADX_STRONG_TREND, ADX_VERY_STRONG_TREND,
+    ADX_TREND_THRESHOLD, ADX_STRONG_TREND,
+    ADX_TREND_LEVELS, ADX_TREND_STRENGTHS,
     CCI_MILDLY_BEARISH, CCI_OVERBOUGHT, CCI_EXTREMELY_OVERBOUGHT,
     CCI_MILDLY_BULLISH, CCI_OVERSOLD, CCI_EXTREMELY_OVERSOLD,
     BB_POSITION_THRESHOLD,
     RATING_MAX, RATING_MIN,
+    RATING_SIGNALS, STRICT_RATING_SIGNALS,
 )
 
 logger = logging.getLogger(__name__)
@@ -111,17 +113,7 @@ def compute_bb_rating_signal(
         rating = -1  # Mildly bearish
     
     # Mean reversion strategy: Overbought → Sell, Oversold → Buy
-    signal = Signal.NEUTRAL
-    if rating == 3:
-        signal = Signal.STRONG_SELL  # Extremely overbought
-    elif rating == 2:
-        signal = Signal.SELL  # Overbought
-    elif rating == -2:
-        signal = Signal.BUY  # Oversold
-    elif rating == -3:
-        signal = Signal.STRONG_BUY  # Extremely oversold
-    
-    return rating, signal.value
+    return rating, STRICT_RATING_SIGNALS[rating - RATING_MIN]
 
 
 def compute_stoch_rsi_signal(stoch_k: float, stoch_d: float) -> Tuple[int, str]:
@@ -161,17 +153,7 @@ def compute_stoch_rsi_signal(stoch_k: float, stoch_d: float) -> Tuple[int, str]:
         rating = min(rating + 1, RATING_MAX)
     
     # Generate signal
-    signal = Signal.NEUTRAL
-    if rating <= -3:
-        signal = Signal.STRONG_BUY
-    elif rating == -2:
-        signal = Signal.BUY
-    elif rating >= 3:
-        signal = Signal.STRONG_SELL
-    elif rating == 2:
-        signal = Signal.SELL
-    
-    return rating, signal.value
+    return rating, STRICT_RATING_SIGNALS[rating - RATING_MIN]
 
 
 def compute_macd_signal(macd: float, macd_signal_line: float, macd_histogram: float) -> Tuple[int, str]:
@@ -211,22 +193,8 @@ def compute_macd_signal(macd: float, macd_signal_line: float, macd_histogram: fl
         else:
             rating = 1  # Weak bearish signal
     
-    # Generate signal
-    signal = Signal.NEUTRAL
-    if rating <= -3:
-        signal = Signal.STRONG_BUY
-    elif rating == -2:
-        signal = Signal.BUY
-    elif rating == -1:
-        signal = Signal.BUY  # Weak buy still counts as buy
-    elif rating == 1:
-        signal = Signal.SELL  # Weak sell still counts as sell
-    elif rating == 2:
-        signal = Signal.SELL
-    elif rating >= 3:
-        signal = Signal.STRONG_SELL
-    
-    return rating, signal.value
+    # Generate signal (weak buy/sell still count as buy/sell)
+    return rating, RATING_SIGNALS[rating - RATING_MIN]
 
 
 def compute_adx_signal(adx: float, plus_di: float, minus_di: float) -> Tuple[int, str, float]:
@@ -246,17 +214,8 @@ def compute_adx_signal(adx: float, plus_di: float, minus_di: float) -> Tuple[int
     Returns:
         Tuple of (rating, signal, trend_strength)
     """
-    # Calculate trend strength (0.0 to 1.0)
-    if adx > ADX_VERY_STRONG_TREND:
-        trend_strength = 1.0  # Very strong trend
-    elif adx > ADX_STRONG_TREND:
-        trend_strength = 0.85  # Strong trend
-    elif adx > ADX_TREND_THRESHOLD:
-        trend_strength = 0.7  # Moderate trend
-    elif adx > ADX_WEAK_TREND:
-        trend_strength = 0.4  # Weak trend
-    else:
-        trend_strength = 0.2  # Very weak/no trend
+    # Calculate trend strength (0.0 to 1.0), from very weak/no trend to very strong
+    trend_strength = ADX_TREND_STRENGTHS[bisect_left(ADX_TREND_LEVELS, adx)]
     
     rating = 0
     
@@ -279,17 +238,7 @@ def compute_adx_signal(adx: float, plus_di: float, minus_di: float) -> Tuple[int
             rating = 1  # Weak bearish trend
     
     # Generate signal
-    signal = Signal.NEUTRAL
-    if rating <= -3:
-        signal = Signal.STRONG_BUY
-    elif rating == -2:
-        signal = Signal.BUY
-    elif rating >= 3:
-        signal = Signal.STRONG_SELL
-    elif rating == 2:
-        signal = Signal.SELL
-    
-    return rating, signal.value, trend_strength
+    return rating, STRICT_RATING_SIGNALS[rating - RATING_MIN], trend_strength
 
 
 def compute_cci_signal(cci: float) -> Tuple[int, str]:
@@ -323,14 +272,4 @@ def compute_cci_signal(cci: float) -> Tuple[int, str]:
         rating = -1  # Mildly oversold
     
     # Generate signal (mean reversion)
-    signal = Signal.NEUTRAL
-    if rating <= -3:
-        signal = Signal.STRONG_BUY
-    elif rating == -2:
-        signal = Signal.BUY
-    elif rating >= 3:
-        signal = Signal.STRONG_SELL
-    elif rating == 2:
-        signal = Signal.SELL
-    
-    return rating, signal.value
+    return rating, STRICT_RATING_SIGNALS[rating - RATING_MIN]
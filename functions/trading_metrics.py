@@ -5,28 +5,42 @@ Includes input validation and proper error handling.
 """
 
 from __future__ import annotations
-from typing import Dict, Optional, List, Tuple
+from typing import Dict, Iterable, Mapping, Optional, List, Sequence, Tuple, Union
 import logging
+import os
+from operator import itemgetter
+
+import numpy as np
 
 from trading_constants import (
     Signal, DEFAULT_WEIGHTS,
     STOCH_MIN, STOCH_MAX,
+    STOCH_OVERSOLD, STOCH_EXTREMELY_OVERSOLD,
+    STOCH_OVERBOUGHT, STOCH_EXTREMELY_OVERBOUGHT, STOCH_MIDPOINT,
+    MACD_HIST_MODERATE, MACD_HIST_STRONG,
     ADX_MIN, ADX_MAX,
+    ADX_TREND_THRESHOLD, ADX_STRONG_TREND,
     CCI_TYPICAL_MIN, CCI_TYPICAL_MAX,
+    CCI_MILDLY_BEARISH, CCI_OVERBOUGHT, CCI_EXTREMELY_OVERBOUGHT,
+    CCI_MILDLY_BULLISH, CCI_OVERSOLD, CCI_EXTREMELY_OVERSOLD,
+    BB_POSITION_THRESHOLD,
     MIN_VALID_PRICE,
     RATING_MAX, RATING_MIN,
+    RATING_SIGNALS, STRICT_RATING_SIGNALS,
+    ADX_TREND_LEVELS, ADX_TREND_STRENGTHS,
 )
-from trading_indicators import (
-    compute_change, compute_bbw,
-    compute_bb_rating_signal,
-    compute_stoch_rsi_signal,
-    compute_macd_signal,
-    compute_adx_signal,
-    compute_cci_signal,
-)
+from trading_indicators import compute_change, compute_bbw
+
+# Prefer the ahead-of-time build (see build_aot.py) to skip JIT on cold start
+try:
+    from trading_metrics_aot import score_row as score_row_nb
+except ImportError:
+    from trading_indicators_nb import score_row_nb
 
 logger = logging.getLogger(__name__)
 
+_NEUTRAL = Signal.NEUTRAL.value
+
 
 def validate_indicators(indicators: Dict) -> None:
     """
@@ -39,18 +53,10 @@ def validate_indicators(indicators: Dict) -> None:
         KeyError: If required indicators are missing
         ValueError: If indicator values are invalid
     """
-    # Check required keys
-    required_keys = [
-        "open", "close",
-        "SMA20", "BB.upper", "BB.lower",
-        "StochRSI.K", "StochRSI.D",
-        "MACD", "MACD.signal", "MACD.histogram",
-        "ADX", "ADX.plus_di", "ADX.minus_di",
-        "CCI",
-    ]
-    
-    missing_keys = [key for key in required_keys if key not in indicators]
-    if missing_keys:
+    # Check required keys (one set difference; ordered list only on failure)
+    missing = _REQUIRED_KEYS.difference(indicators.keys())
+    if missing:
+        missing_keys = [key for key in INDICATOR_KEYS if key in missing]
         raise KeyError(f"Missing required indicators: {missing_keys}")
     
     # Validate price data
@@ -97,6 +103,27 @@ def validate_indicators(indicators: Dict) -> None:
         logger.warning(f"CCI value {cci} is outside typical range [{CCI_TYPICAL_MIN}, {CCI_TYPICAL_MAX}]")
 
 
+def _direction_counts(ratings: Iterable[int]) -> Tuple[int, int, int]:
+    """
+    Count bullish, bearish and neutral ratings in a single pass.
+    
+    Args:
+        ratings: Indicator ratings (negative = bullish, positive = bearish)
+    
+    Returns:
+        Tuple of (bullish, bearish, neutral) counts
+    """
+    bullish = bearish = neutral = 0
+    for rating in ratings:
+        if rating < 0:
+            bullish += 1
+        elif rating > 0:
+            bearish += 1
+        else:
+            neutral += 1
+    return bullish, bearish, neutral
+
+
 def compute_composite_signal(ratings: List[Tuple[str, int, float]]) -> Tuple[int, str, Dict]:
     """
     Calculate composite signal from all indicators using weighted average.
@@ -108,7 +135,7 @@ def compute_composite_signal(ratings: List[Tuple[str, int, float]]) -> Tuple[int
         Tuple of (composite_rating, composite_signal, breakdown)
     """
     if not ratings:
-        return 0, Signal.NEUTRAL.value, {}
+        return 0, _NEUTRAL, {}
     
     # Calculate weighted average
     weighted_sum = sum(rating * weight for _, rating, weight in ratings)
@@ -120,32 +147,157 @@ def compute_composite_signal(ratings: List[Tuple[str, int, float]]) -> Tuple[int
     # Cap rating at min/max
     composite_rating = max(RATING_MIN, min(RATING_MAX, composite_rating))
     
-    # Generate signal
-    signal = Signal.NEUTRAL
-    if composite_rating <= -3:
-        signal = Signal.STRONG_BUY
-    elif composite_rating == -2:
-        signal = Signal.BUY
-    elif composite_rating == -1:
-        signal = Signal.BUY  # Lean bullish
-    elif composite_rating == 1:
-        signal = Signal.SELL  # Lean bearish
-    elif composite_rating == 2:
-        signal = Signal.SELL
-    elif composite_rating >= 3:
-        signal = Signal.STRONG_SELL
-    
-    # Create breakdown
+    # Generate signal (+/-1 leans bullish/bearish)
+    signal = RATING_SIGNALS[composite_rating - RATING_MIN]
+    
+    # Create breakdown (negative rating = bullish, positive = bearish)
+    bullish, bearish, neutral = _direction_counts(r for _, r, _ in ratings)
+    score = round(raw_score, 2)
     breakdown = {
-        "raw_score": round(raw_score, 2),
-        "weighted_score": round(raw_score, 2),
-        "bullish_indicators": sum(1 for _, r, _ in ratings if r < 0),  # Negative rating = bullish
-        "bearish_indicators": sum(1 for _, r, _ in ratings if r > 0),  # Positive rating = bearish
-        "neutral_indicators": sum(1 for _, r, _ in ratings if r == 0),
+        "raw_score": score,
+        "weighted_score": score,
+        "bullish_indicators": bullish,
+        "bearish_indicators": bearish,
+        "neutral_indicators": neutral,
         "total_indicators": len(ratings),
     }
     
-    return composite_rating, signal.value, breakdown
+    return composite_rating, signal, breakdown
+
+
+# Weight keys in score_row_nb() argument order; missing keys weigh 1.0
+WEIGHT_KEYS = ("bb", "stoch_rsi", "macd", "adx", "cci")
+
+
+def _weight_vector(weights: Dict[str, float]) -> Tuple[float, ...]:
+    """
+    Resolve a weights dictionary to floats in WEIGHT_KEYS order.
+    
+    Args:
+        weights: Weight per indicator key
+    
+    Returns:
+        Tuple of five weights, ready to pass to score_row_nb()
+    """
+    return tuple(float(weights.get(key, 1.0)) for key in WEIGHT_KEYS)
+
+
+# DEFAULT_WEIGHTS resolved once at import, used when no weights are passed
+_DEFAULT_WEIGHT_VECTOR = _weight_vector(DEFAULT_WEIGHTS)
+
+# Band position by (close > upper) << 1 | (close < lower); above_upper wins a tie
+_BB_POSITIONS = ("in_range", "below_lower", "above_upper", "above_upper")
+
+
+def _build_result(
+    values: Sequence[float],
+    change: float,
+    bbw: Optional[float],
+    scores: Tuple,
+) -> Dict:
+    """
+    Assemble the compute_metrics() result dictionary.
+    
+    Args:
+        values: Indicator values in INDICATOR_KEYS order
+        change: Percentage change from open to close
+        bbw: Bollinger Band Width (None if SMA is invalid)
+        scores: Tuple returned by score_row_nb()
+    
+    Returns:
+        Dictionary with comprehensive metrics and signals
+    """
+    (
+        bb_rating, stoch_rating, macd_rating, adx_rating, cci_rating,
+        trend_strength, raw_score, composite_rating,
+    ) = scores
+    
+    (
+        _, close,
+        bb_middle, bb_upper, bb_lower,
+        stoch_k, stoch_d,
+        macd, macd_signal_line, macd_histogram,
+        adx, plus_di, minus_di,
+        cci,
+    ) = values
+    
+    bb_signal = STRICT_RATING_SIGNALS[bb_rating - RATING_MIN]
+    stoch_signal = STRICT_RATING_SIGNALS[stoch_rating - RATING_MIN]
+    macd_signal = RATING_SIGNALS[macd_rating - RATING_MIN]
+    adx_signal = STRICT_RATING_SIGNALS[adx_rating - RATING_MIN]
+    cci_signal = STRICT_RATING_SIGNALS[cci_rating - RATING_MIN]
+    composite_signal = RATING_SIGNALS[composite_rating - RATING_MIN]
+    
+    ratings = (bb_rating, stoch_rating, macd_rating, adx_rating, cci_rating)
+    bullish, bearish, neutral = _direction_counts(ratings)  # Negative rating = bullish
+    score = round(raw_score, 2)
+    trend_strength = round(trend_strength, 2)
+    breakdown = {
+        "raw_score": score,
+        "weighted_score": score,
+        "bullish_indicators": bullish,
+        "bearish_indicators": bearish,
+        "neutral_indicators": neutral,
+        "total_indicators": len(ratings),
+    }
+    
+    # Build comprehensive result
+    return {
+        # Basic metrics
+        "price": round(close, 4),
+        "change": round(change, 3),
+    
+        # Composite signal (overall recommendation)
+        "composite": {
+            "rating": composite_rating,
+            "signal": composite_signal,
+            "breakdown": breakdown,
+            "trend_strength": trend_strength,
+        },
+    
+        # Individual indicator signals
+        "indicators": {
+            "bollinger_bands": {
+                "rating": bb_rating,
+                "signal": bb_signal,
+                "width": round(bbw, 4) if bbw is not None else None,
+                "upper": round(bb_upper, 4),
+                "middle": round(bb_middle, 4),
+                "lower": round(bb_lower, 4),
+                "position": _BB_POSITIONS[(close > bb_upper) << 1 | (close < bb_lower)],
+            },
+            "stochastic_rsi": {
+                "rating": stoch_rating,
+                "signal": stoch_signal,
+                "k": round(stoch_k, 2),
+                "d": round(stoch_d, 2),
+                "position": "overbought" if stoch_k > 80 else "oversold" if stoch_k < 20 else "neutral",
+            },
+            "macd": {
+                "rating": macd_rating,
+                "signal": macd_signal,
+                "value": round(macd, 4),
+                "signal_line": round(macd_signal_line, 4),
+                "histogram": round(macd_histogram, 4),
+                "position": "above_signal" if macd > macd_signal_line else "below_signal",
+            },
+            "adx": {
+                "rating": adx_rating,
+                "signal": adx_signal,
+                "value": round(adx, 2),
+                "plus_di": round(plus_di, 2),
+                "minus_di": round(minus_di, 2),
+                "trend_strength": trend_strength,
+                "trend_quality": "strong" if adx > 25 else "weak",
+            },
+            "cci": {
+                "rating": cci_rating,
+                "signal": cci_signal,
+                "value": round(cci, 2),
+                "position": "overbought" if cci > 100 else "oversold" if cci < -100 else "neutral",
+            },
+        },
+    }
 
 
 def compute_metrics(
@@ -183,120 +335,38 @@ def compute_metrics(
         ... }
         >>> result = compute_metrics(indicators)
     """
-    # Use default weights if not provided
-    weights = weights or DEFAULT_WEIGHTS
-    
     try:
         # Validate input data
         if validate:
             validate_indicators(indicators)
         
-        # Extract basic price data
-        open_price = indicators["open"]
-        close = indicators["close"]
-        
-        # Extract Bollinger Bands
-        sma = indicators["SMA20"]
-        bb_upper = indicators["BB.upper"]
-        bb_lower = indicators["BB.lower"]
+        # Extract every indicator in INDICATOR_KEYS order with one itemgetter call
+        values = _get_indicator_values(indicators)
+        (
+            open_price, close,
+            sma, bb_upper, bb_lower,
+            stoch_k, stoch_d,
+            macd, macd_signal_line, macd_histogram,
+            adx, plus_di, minus_di,
+            cci,
+        ) = values
         bb_middle = sma
         
-        # Extract Stochastic RSI
-        stoch_k = indicators["StochRSI.K"]
-        stoch_d = indicators["StochRSI.D"]
-        
-        # Extract MACD
-        macd = indicators["MACD"]
-        macd_signal_line = indicators["MACD.signal"]
-        macd_histogram = indicators["MACD.histogram"]
-        
-        # Extract ADX
-        adx = indicators["ADX"]
-        plus_di = indicators["ADX.plus_di"]
-        minus_di = indicators["ADX.minus_di"]
-        
-        # Extract CCI
-        cci = indicators["CCI"]
-        
         # Calculate basic metrics
         change = compute_change(open_price, close)
         bbw = compute_bbw(sma, bb_upper, bb_lower)
         
-        # Calculate signals from each indicator
-        bb_rating, bb_signal = compute_bb_rating_signal(close, bb_upper, bb_middle, bb_lower)
-        stoch_rating, stoch_signal = compute_stoch_rsi_signal(stoch_k, stoch_d)
-        macd_rating, macd_signal = compute_macd_signal(macd, macd_signal_line, macd_histogram)
-        adx_rating, adx_signal, trend_strength = compute_adx_signal(adx, plus_di, minus_di)
-        cci_rating, cci_signal = compute_cci_signal(cci)
+        # Score all indicators in one (numba-compiled when available) call
+        scores = score_row_nb(
+            float(close), float(bb_upper), float(bb_middle), float(bb_lower),
+            float(stoch_k), float(stoch_d),
+            float(macd), float(macd_signal_line), float(macd_histogram),
+            float(adx), float(plus_di), float(minus_di),
+            float(cci),
+            *(_weight_vector(weights) if weights else _DEFAULT_WEIGHT_VECTOR),
+        )
         
-        # Calculate composite signal
-        ratings_list = [
-            ("BB", bb_rating, weights.get("bb", 1.0)),
-            ("StochRSI", stoch_rating, weights.get("stoch_rsi", 1.0)),
-            ("MACD", macd_rating, weights.get("macd", 1.0)),
-            ("ADX", adx_rating, weights.get("adx", 1.0)),
-            ("CCI", cci_rating, weights.get("cci", 1.0)),
-        ]
-        
-        composite_rating, composite_signal, breakdown = compute_composite_signal(ratings_list)
-        
-        # Build comprehensive result
-        return {
-            # Basic metrics
-            "price": round(close, 4),
-            "change": round(change, 3),
-            
-            # Composite signal (overall recommendation)
-            "composite": {
-                "rating": composite_rating,
-                "signal": composite_signal,
-                "breakdown": breakdown,
-                "trend_strength": round(trend_strength, 2),
-            },
-            
-            # Individual indicator signals
-            "indicators": {
-                "bollinger_bands": {
-                    "rating": bb_rating,
-                    "signal": bb_signal,
-                    "width": round(bbw, 4) if bbw is not None else None,
-                    "upper": round(bb_upper, 4),
-                    "middle": round(bb_middle, 4),
-                    "lower": round(bb_lower, 4),
-                    "position": "above_upper" if close > bb_upper else "below_lower" if close < bb_lower else "in_range",
-                },
-                "stochastic_rsi": {
-                    "rating": stoch_rating,
-                    "signal": stoch_signal,
-                    "k": round(stoch_k, 2),
-                    "d": round(stoch_d, 2),
-                    "position": "overbought" if stoch_k > 80 else "oversold" if stoch_k < 20 else "neutral",
-                },
-                "macd": {
-                    "rating": macd_rating,
-                    "signal": macd_signal,
-                    "value": round(macd, 4),
-                    "signal_line": round(macd_signal_line, 4),
-                    "histogram": round(macd_histogram, 4),
-                    "position": "above_signal" if macd > macd_signal_line else "below_signal",
-                },
-                "adx": {
-                    "rating": adx_rating,
-                    "signal": adx_signal,
-                    "value": round(adx, 2),
-                    "plus_di": round(plus_di, 2),
-                    "minus_di": round(minus_di, 2),
-                    "trend_strength": round(trend_strength, 2),
-                    "trend_quality": "strong" if adx > 25 else "weak",
-                },
-                "cci": {
-                    "rating": cci_rating,
-                    "signal": cci_signal,
-                    "value": round(cci, 2),
-                    "position": "overbought" if cci > 100 else "oversold" if cci < -100 else "neutral",
-                },
-            },
-        }
+        return _build_result(values, change, bbw, scores)
         
     except KeyError as e:
         logger.error(f"Missing required indicator: {e}", exc_info=True)
@@ -307,3 +377,268 @@ def compute_metrics(
     except (TypeError, ZeroDivisionError) as e:
         logger.error(f"Error computing metrics: {e}", exc_info=True)
         return None
+
+
+# ==================== BATCH SCORING ====================
+
+# Column order for indicator matrices passed to compute_metrics_batch()
+INDICATOR_KEYS = (
+    "open", "close",
+    "SMA20", "BB.upper", "BB.lower",
+    "StochRSI.K", "StochRSI.D",
+    "MACD", "MACD.signal", "MACD.histogram",
+    "ADX", "ADX.plus_di", "ADX.minus_di",
+    "CCI",
+)
+
+# Fetches all INDICATOR_KEYS from a mapping at once (KeyError on the first missing key)
+_get_indicator_values = itemgetter(*INDICATOR_KEYS)
+
+# Keys validate_indicators() requires
+_REQUIRED_KEYS = frozenset(INDICATOR_KEYS)
+
+# ADX trend strength tables as arrays, for np.searchsorted over a column
+_ADX_TREND_LEVELS = np.array(ADX_TREND_LEVELS)
+_ADX_TREND_STRENGTHS = np.array(ADX_TREND_STRENGTHS)
+
+# RATING_SIGNALS as an array, for resolving whole rating columns at once
+_RATING_SIGNALS_ARRAY = np.array(RATING_SIGNALS, dtype=object)
+
+
+def indicators_to_array(rows: Iterable[Dict]) -> np.ndarray:
+    """
+    Stack indicator dictionaries into an (N, K) matrix in INDICATOR_KEYS order.
+    
+    Missing or None values become NaN, which compute_metrics_batch() treats
+    as invalid rows.
+    
+    Args:
+        rows: Indicator dictionaries (same format as compute_metrics input)
+    
+    Returns:
+        float64 array of shape (N, len(INDICATOR_KEYS))
+    """
+    data = [
+        [np.nan if row.get(key) is None else row[key] for key in INDICATOR_KEYS]
+        for row in rows
+    ]
+    return np.array(data, dtype=np.float64).reshape(len(data), len(INDICATOR_KEYS))
+
+
+def _as_indicator_matrix(X: Union[np.ndarray, Mapping], dtype=np.float64) -> np.ndarray:
+    """
+    Normalize batch input to an (N, K) matrix in INDICATOR_KEYS order.
+    
+    Args:
+        X: Indicator matrix, or a mapping (dict of 1-D arrays, DataFrame)
+            with one column per INDICATOR_KEYS entry; missing columns are NaN
+        dtype: Floating point type of the returned matrix
+    
+    Returns:
+        Array of shape (N, len(INDICATOR_KEYS))
+    """
+    if not hasattr(X, "keys"):
+        return np.asarray(X, dtype=dtype)
+    
+    present = [key for key in INDICATOR_KEYS if key in X]
+    n = len(np.asarray(X[present[0]])) if present else 0
+    matrix = np.full((n, len(INDICATOR_KEYS)), np.nan, dtype=dtype)
+    for j, key in enumerate(INDICATOR_KEYS):
+        if key in X:
+            matrix[:, j] = np.asarray(X[key], dtype=dtype)
+    return matrix
+
+
+def compute_metrics_batch(
+    X: Union[np.ndarray, Mapping],
+    weights: Optional[Dict[str, float]] = None,
+    dtype=np.float64,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized compute_metrics() over many symbols at once.
+    
+    Applies the same rating rules as score_row_nb() column-wise, so each
+    threshold comparison runs once for the whole batch.
+    
+    Args:
+        X: Indicator matrix of shape (N, K) in INDICATOR_KEYS order, or a
+            mapping of INDICATOR_KEYS names to length-N columns (dict of
+            arrays or DataFrame)
+        weights: Optional custom weights for each indicator
+        dtype: Working precision for the indicator matrix. np.float32 halves
+            memory traffic on large batches; values within float32 rounding
+            of a threshold may then rate differently than compute_metrics()
+    
+    Returns:
+        Dictionary of length-N arrays: valid, change, bbw, bb_rating,
+        stoch_rating, macd_rating, adx_rating, cci_rating, trend_strength,
+        raw_score, composite_rating. Rows where valid is False would have
+        been rejected by validate_indicators() and hold meaningless scores.
+    """
+    X = _as_indicator_matrix(X, dtype)
+    (
+        open_price, close, sma, bb_upper, bb_lower,
+        stoch_k, stoch_d, macd, macd_sig, macd_hist,
+        adx, plus_di, minus_di, cci,
+    ) = X.T
+    
+    valid = (
+        ~np.isnan(X).any(axis=1)
+        & (open_price > MIN_VALID_PRICE) & (close > MIN_VALID_PRICE)
+        & (bb_upper > bb_lower)
+        & (stoch_k >= STOCH_MIN) & (stoch_k <= STOCH_MAX)
+        & (stoch_d >= STOCH_MIN) & (stoch_d <= STOCH_MAX)
+        & (adx >= ADX_MIN) & (adx <= ADX_MAX)
+    )
+    
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change = np.where(open_price != 0, (close - open_price) / open_price * 100, 0.0)
+        bbw = np.where(sma != 0, (bb_upper - bb_lower) / sma, np.nan)
+    
+    # Bollinger Bands (mean reversion)
+    upper_half = sma + (bb_upper - sma) * BB_POSITION_THRESHOLD
+    lower_half = sma - (sma - bb_lower) * BB_POSITION_THRESHOLD
+    bb_rating = np.select(
+        [close > bb_upper, close > upper_half, close > sma,
+         close < bb_lower, close < lower_half, close < sma],
+        [3, 2, 1, -3, -2, -1], 0,
+    )
+    
+    # Stochastic RSI: level, then crossover conviction
+    stoch_rating = np.select(
+        [stoch_k < STOCH_EXTREMELY_OVERSOLD, stoch_k < STOCH_OVERSOLD,
+         stoch_k > STOCH_EXTREMELY_OVERBOUGHT, stoch_k > STOCH_OVERBOUGHT],
+        [-3, -2, 3, 2], 0,
+    )
+    bull_cross = (stoch_k > stoch_d) & (stoch_k < STOCH_MIDPOINT)
+    bear_cross = (stoch_k < stoch_d) & (stoch_k > STOCH_MIDPOINT)
+    stoch_rating = np.where(
+        bull_cross, np.maximum(stoch_rating - 1, RATING_MIN),
+        np.where(bear_cross, np.minimum(stoch_rating + 1, RATING_MAX), stoch_rating),
+    )
+    
+    # MACD (trend following)
+    above = macd > macd_sig
+    below = macd < macd_sig
+    macd_rating = np.select(
+        [above & (macd_hist > MACD_HIST_STRONG), above & (macd_hist > MACD_HIST_MODERATE), above,
+         below & (macd_hist < -MACD_HIST_STRONG), below & (macd_hist < -MACD_HIST_MODERATE), below],
+        [-3, -2, -1, 3, 2, 1], 0,
+    )
+    
+    # ADX: direction from DI, magnitude from ADX
+    trend_strength = _ADX_TREND_STRENGTHS[np.searchsorted(_ADX_TREND_LEVELS, adx, side="left")]
+    direction = np.where(plus_di > minus_di, -1, np.where(minus_di > plus_di, 1, 0))
+    adx_rating = direction * np.select([adx > ADX_STRONG_TREND, adx > ADX_TREND_THRESHOLD], [3, 2], 1)
+    
+    # CCI (mean reversion)
+    cci_rating = np.select(
+        [cci > CCI_EXTREMELY_OVERBOUGHT, cci > CCI_OVERBOUGHT, cci > CCI_MILDLY_BEARISH,
+         cci < CCI_EXTREMELY_OVERSOLD, cci < CCI_OVERSOLD, cci < CCI_MILDLY_BULLISH],
+        [3, 2, 1, -3, -2, -1], 0,
+    )
+    
+    # Composite (summed in the same order as score_row_nb for identical rounding)
+    w_bb, w_stoch, w_macd, w_adx, w_cci = _weight_vector(weights) if weights else _DEFAULT_WEIGHT_VECTOR
+    total_weight = w_bb + w_stoch + w_macd + w_adx + w_cci
+    weighted_sum = (
+        bb_rating * w_bb + stoch_rating * w_stoch + macd_rating * w_macd
+        + adx_rating * w_adx + cci_rating * w_cci
+    )
+    raw_score = weighted_sum / total_weight if total_weight else np.zeros(len(X))
+    composite_rating = np.clip(np.round(raw_score), RATING_MIN, RATING_MAX).astype(np.int64)
+    
+    return {
+        "valid": valid,
+        "change": change,
+        "bbw": bbw,
+        "bb_rating": bb_rating,
+        "stoch_rating": stoch_rating,
+        "macd_rating": macd_rating,
+        "adx_rating": adx_rating,
+        "cci_rating": cci_rating,
+        "trend_strength": trend_strength,
+        "raw_score": raw_score,
+        "composite_rating": composite_rating,
+    }
+
+
+def expand_metrics_batch(X: Union[np.ndarray, Mapping], batch: Dict[str, np.ndarray]) -> List[Optional[Dict]]:
+    """
+    Convert compute_metrics_batch() output into per-symbol result dictionaries.
+    
+    Args:
+        X: Indicator matrix or column mapping passed to compute_metrics_batch()
+        batch: Output of compute_metrics_batch()
+    
+    Returns:
+        List of compute_metrics()-shaped dictionaries (None for invalid rows)
+    """
+    score_columns = [
+        batch[name].tolist() for name in (
+            "bb_rating", "stoch_rating", "macd_rating", "adx_rating", "cci_rating",
+            "trend_strength", "raw_score", "composite_rating",
+        )
+    ]
+    change = batch["change"].tolist()
+    bbw = batch["bbw"].tolist()
+    
+    results: List[Optional[Dict]] = []
+    for i, (row, is_valid) in enumerate(zip(_as_indicator_matrix(X).tolist(), batch["valid"].tolist())):
+        if not is_valid:
+            results.append(None)
+            continue
+        row_bbw = None if bbw[i] != bbw[i] else bbw[i]  # NaN marks an invalid SMA
+        scores = tuple(column[i] for column in score_columns)
+        results.append(_build_result(row, change[i], row_bbw, scores))
+    return results
+
+
+def compute_metrics_frame(df, weights: Optional[Dict[str, float]] = None):
+    """
+    compute_metrics_batch() for a DataFrame, returning a DataFrame.
+    
+    Args:
+        df: pandas DataFrame with one row per symbol and INDICATOR_KEYS columns
+        weights: Optional custom weights for each indicator
+    
+    Returns:
+        DataFrame on df's index with the compute_metrics_batch() columns plus
+        composite_signal
+    """
+    import pandas as pd
+    
+    batch = compute_metrics_batch(df, weights)
+    batch["composite_signal"] = _RATING_SIGNALS_ARRAY[batch["composite_rating"] - RATING_MIN]
+    return pd.DataFrame(batch, index=df.index)
+
+
+# ==================== WARMUP ====================
+
+# Set TRADING_WARMUP=1 to run warmup() when this module is imported
+WARMUP_ENV = "TRADING_WARMUP"
+
+# Representative in-range row used by warmup()
+_WARMUP_INDICATORS = {
+    "open": 100.0, "close": 102.5,
+    "SMA20": 101.0, "BB.upper": 105.0, "BB.lower": 97.0,
+    "StochRSI.K": 35.0, "StochRSI.D": 30.0,
+    "MACD": 0.5, "MACD.signal": 0.3, "MACD.histogram": 0.2,
+    "ADX": 28.0, "ADX.plus_di": 25.0, "ADX.minus_di": 15.0,
+    "CCI": -50.0,
+}
+
+
+def warmup() -> None:
+    """
+    Run the scalar and batch scoring paths once on a dummy row.
+    
+    Loads the compiled scoring kernel and touches every code path before
+    the first live tick, so that tick doesn't pay for it.
+    """
+    compute_metrics(_WARMUP_INDICATORS)
+    compute_metrics_batch(indicators_to_array([_WARMUP_INDICATORS]))
+
+
+if os.environ.get(WARMUP_ENV) == "1":
+    warmup()
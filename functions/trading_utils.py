@@ -12,6 +12,21 @@ from trading_constants import Signal, TREND_STRENGTH_MODERATE, TREND_STRENGTH_WE
 
 logger = logging.getLogger(__name__)
 
+# Signal strings, resolved once from the enum
+_STRONG_BUY = Signal.STRONG_BUY.value
+_BUY = Signal.BUY.value
+_NEUTRAL = Signal.NEUTRAL.value
+_SELL = Signal.SELL.value
+_STRONG_SELL = Signal.STRONG_SELL.value
+
+SIGNAL_EMOJI = {
+    _STRONG_BUY: "🟢🟢",
+    _BUY: "🟢",
+    _NEUTRAL: "⚪",
+    _SELL: "🔴",
+    _STRONG_SELL: "🔴🔴",
+}
+
 
 def get_trading_recommendation(metrics: Dict) -> str:
     """
@@ -44,15 +59,7 @@ def get_trading_recommendation(metrics: Dict) -> str:
     lines.append("=" * 50)
     
     # Signal and rating
-    signal_emoji = {
-        Signal.STRONG_BUY.value: "🟢🟢",
-        Signal.BUY.value: "🟢",
-        Signal.NEUTRAL.value: "⚪",
-        Signal.SELL.value: "🔴",
-        Signal.STRONG_SELL.value: "🔴🔴",
-    }
-    
-    lines.append(f"\n{signal_emoji.get(signal, '⚪')} Signal: {signal}")
+    lines.append(f"\n{SIGNAL_EMOJI.get(signal, '⚪')} Signal: {signal}")
     lines.append(f"📈 Rating: {rating}/3 (Raw Score: {raw_score})")
     
     # Trend strength
@@ -72,16 +79,16 @@ def get_trading_recommendation(metrics: Dict) -> str:
     
     # Action recommendation
     lines.append(f"\n💡 Recommended Action:")
-    if signal == Signal.STRONG_BUY.value:
+    if signal == _STRONG_BUY:
         lines.append("   ✅ STRONG BUY - Consider entering long positions")
         lines.append("   ✅ High conviction bullish signal")
-    elif signal == Signal.BUY.value:
+    elif signal == _BUY:
         lines.append("   ✅ BUY - Consider long positions or hold existing longs")
         lines.append("   ✅ Moderate bullish signal")
-    elif signal == Signal.SELL.value:
+    elif signal == _SELL:
         lines.append("   ⚠️ SELL - Consider closing longs or entering shorts")
         lines.append("   ⚠️ Moderate bearish signal")
-    elif signal == Signal.STRONG_SELL.value:
+    elif signal == _STRONG_SELL:
         lines.append("   🛑 STRONG SELL - Consider closing longs or shorting")
         lines.append("   🛑 High conviction bearish signal")
     else:
@@ -166,17 +166,18 @@ class PaperTradingDB:
         """Get all open trades"""
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        trades = self._query_open_trades(conn.cursor())
+        conn.close()
+        return trades
 
+    def _query_open_trades(self, cursor) -> List[Dict]:
+        """Run the open trades query on an existing cursor"""
         cursor.execute("""
             SELECT * FROM paper_trades
             WHERE status IN ('OPEN', 'TP1_HIT')
             ORDER BY entry_time DESC
         """)
-
-        trades = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return trades
+        return [dict(row) for row in cursor.fetchall()]
 
     def update_trade_check(self, trade_id: str, current_price_usd: float,
                           current_price_kes: float) -> Dict:
@@ -184,23 +185,66 @@ class PaperTradingDB:
         Check trade against current price and update status
         Returns updated trade status
         """
+        return self.update_trade_checks_bulk([(trade_id, current_price_usd, current_price_kes)])[0]
+
+    def update_trade_checks_bulk(self, checks: List[Tuple[str, float, float]]) -> List[Dict]:
+        """
+        Check many trades against current prices in a single transaction
+        checks: (trade_id, current_price_usd, current_price_kes) tuples
+        Returns one updated trade status per check, in the same order
+        """
+        if not checks:
+            return []
+
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
-        # Get trade
-        cursor.execute("SELECT * FROM paper_trades WHERE trade_id = ?", (trade_id,))
-        row = cursor.fetchone()
+        # Get all trades in one query
+        trade_ids = list({check[0] for check in checks})
+        placeholders = ','.join('?' * len(trade_ids))
+        cursor.execute(f"SELECT * FROM paper_trades WHERE trade_id IN ({placeholders})", trade_ids)
+        trades = {row['trade_id']: dict(row) for row in cursor.fetchall()}
+
+        results = []
+        check_rows = []
+        checked = set()
+        for trade_id, current_price_usd, current_price_kes in checks:
+            if trade_id in checked:
+                # A repeated trade must see the updates from its earlier check
+                cursor.execute("SELECT * FROM paper_trades WHERE trade_id = ?", (trade_id,))
+                trades[trade_id] = dict(cursor.fetchone())
+            trade = trades.get(trade_id)
+            if not trade:
+                results.append({'error': f'Trade {trade_id} not found'})
+                continue
+
+            if trade['status'] in ('CLOSED', 'STOPPED', 'TP2_HIT'):
+                results.append(trade)
+                continue
+
+            result = self._apply_check(cursor, trade, current_price_usd, current_price_kes)
+            checked.add(trade_id)
+            check_rows.append((trade_id, datetime.utcnow(), current_price_usd, current_price_kes,
+                               result['unrealized_pnl_percent'], result['status']))
+            results.append(result)
+
+        # Log trade checks
+        cursor.executemany("""
+            INSERT INTO trade_checks (trade_id, check_time, current_price_usd,
+                                     current_price_kes, unrealized_pnl_percent, status_at_check)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, check_rows)
 
-        if not row:
-            conn.close()
-            return {'error': f'Trade {trade_id} not found'}
+        conn.commit()
+        conn.close()
 
-        trade = dict(row)
+        return results
 
-        if trade['status'] in ('CLOSED', 'STOPPED', 'TP2_HIT'):
-            conn.close()
-            return trade
+    def _apply_check(self, cursor, trade: Dict, current_price_usd: float,
+                     current_price_kes: float) -> Dict:
+        """Apply stop loss/target rules and excursion tracking for one open trade"""
+        trade_id = trade['trade_id']
 
         # Calculate unrealized P&L
         entry = trade['entry_price_usd']
@@ -239,14 +283,6 @@ class PaperTradingDB:
                 cursor.execute("UPDATE paper_trades SET status = 'TP1_HIT' WHERE trade_id = ?", (trade_id,))
                 new_status = 'TP1_HIT'
 
-        # Log trade check
-        cursor.execute("""
-            INSERT INTO trade_checks (trade_id, check_time, current_price_usd,
-                                     current_price_kes, unrealized_pnl_percent, status_at_check)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (trade_id, datetime.utcnow(), current_price_usd, current_price_kes,
-              pnl_percent, new_status))
-
         # Update max favorable/adverse excursion
         current_mfe = trade.get('max_favorable_excursion') or 0
         current_mae = trade.get('max_adverse_excursion') or 0
@@ -265,9 +301,6 @@ class PaperTradingDB:
                 WHERE trade_id = ?
             """, (pnl_percent, trade_id))
 
-        conn.commit()
-        conn.close()
-
         return {
             'trade_id': trade_id,
             'symbol': trade['symbol'],
@@ -336,24 +369,49 @@ class PaperTradingDB:
         """Get closed trade history"""
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        trades = self._query_trade_history(conn.cursor(), limit)
+        conn.close()
+        return trades
 
+    def _query_trade_history(self, cursor, limit: int) -> List[Dict]:
+        """Run the closed trade history query on an existing cursor"""
         cursor.execute("""
             SELECT * FROM paper_trades
             WHERE status IN ('CLOSED', 'STOPPED', 'TP2_HIT')
             ORDER BY exit_time DESC
             LIMIT ?
         """, (limit,))
+        return [dict(row) for row in cursor.fetchall()]
 
-        trades = [dict(row) for row in cursor.fetchall()]
+    def get_trades_closed_since(self, cutoff_iso: str) -> List[Dict]:
+        """Get trades closed at or after an ISO-8601 cutoff, most recent first"""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        trades = self._query_trades_closed_since(conn.cursor(), cutoff_iso)
         conn.close()
         return trades
 
+    def _query_trades_closed_since(self, cursor, cutoff_iso: str) -> List[Dict]:
+        """Run the closed-since query on an existing cursor"""
+        # julianday() normalizes 'T'/space separators, fractional seconds and UTC offsets,
+        # which plain string comparison of the stored timestamps would not
+        cursor.execute("""
+            SELECT * FROM paper_trades
+            WHERE status IN ('CLOSED', 'STOPPED', 'TP2_HIT')
+              AND julianday(exit_time) >= julianday(?)
+            ORDER BY exit_time DESC
+        """, (cutoff_iso,))
+        return [dict(row) for row in cursor.fetchall()]
+
     def get_strategy_stats(self) -> Optional[Dict]:
         """Calculate overall strategy performance"""
         conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        stats = self._query_strategy_stats(conn.cursor())
+        conn.close()
+        return stats
 
+    def _query_strategy_stats(self, cursor) -> Optional[Dict]:
+        """Run the strategy performance query on an existing cursor"""
         cursor.execute("""
             SELECT
                 COUNT(*) as total_trades,
@@ -370,7 +428,6 @@ class PaperTradingDB:
         """)
 
         row = cursor.fetchone()
-        conn.close()
 
         if row[0] == 0:  # No trades
             return None
@@ -390,6 +447,26 @@ class PaperTradingDB:
             'total_pnl_usd': row[8]
         }
 
+    def get_daily_review_snapshot(self, closed_since: str) -> Dict:
+        """
+        Get strategy stats, trades closed since a cutoff and open trades in one read transaction
+        Returns a dict with 'stats', 'closed' and 'open' keys
+        """
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        # One read transaction so all three queries see the same database state
+        cursor.execute("BEGIN")
+        snapshot = {
+            'stats': self._query_strategy_stats(cursor),
+            'closed': self._query_trades_closed_since(cursor, closed_since),
+            'open': self._query_open_trades(cursor)
+        }
+        conn.commit()
+        conn.close()
+        return snapshot
+
     def get_trade_by_id(self, trade_id: str) -> Optional[Dict]:
         """Get a specific trade by ID"""
         conn = sqlite3.connect(self.db_path)
@@ -4,8 +4,21 @@ Test script for paper trading system
 Demonstrates creating a sample trade and checking it
 """
 
+import json
+import os
+import random
+import shutil
+import sqlite3
+import tempfile
+from unittest.mock import MagicMock, patch
+
+import requests
+
 from paper_trading_db import PaperTradingDB
 from datetime import datetime
+from trading_metrics import (
+    compute_metrics, compute_metrics_batch, compute_metrics_frame, expand_metrics_batch, indicators_to_array
+)
 
 def test_paper_trading():
     print("="*60)
@@ -100,5 +113,198 @@ def test_paper_trading():
     print("\nPaper trading system is ready to use!")
     print("Run /majors command in Claude to start trading.")
 
+def _sample_indicator_rows(n=200, seed=7):
+    """Random indicator rows, with every 10th row made invalid in some way"""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        sma = rng.uniform(1, 1000)
+        width = sma * rng.uniform(0.01, 0.2)
+        row = {
+            'open': sma * rng.uniform(0.95, 1.05), 'close': sma + rng.uniform(-2, 2) * width,
+            'SMA20': sma, 'BB.upper': sma + width, 'BB.lower': sma - width,
+            'StochRSI.K': rng.uniform(0, 100), 'StochRSI.D': rng.uniform(0, 100),
+            'MACD': rng.gauss(0, 2), 'MACD.signal': rng.gauss(0, 2), 'MACD.histogram': rng.gauss(0, 2),
+            'ADX': rng.uniform(0, 60), 'ADX.plus_di': rng.uniform(0, 40), 'ADX.minus_di': rng.uniform(0, 40),
+            'CCI': rng.uniform(-300, 300)
+        }
+        if i % 10 == 0:
+            broken = rng.choice([('CCI', None), ('close', 0.0), ('BB.lower', sma * 2), ('StochRSI.K', 120.0), ('ADX', -1.0)])
+            row[broken[0]] = broken[1]
+        rows.append(row)
+    return rows
+
+def test_batch_metrics_match_scalar():
+    rows = _sample_indicator_rows()
+    X = indicators_to_array(rows)
+    batch_results = expand_metrics_batch(X, compute_metrics_batch(X))
+
+    assert len(batch_results) == len(rows)
+    for row, batch_result in zip(rows, batch_results):
+        # Invalid rows come back as None from both paths
+        assert batch_result == compute_metrics(row)
+    assert any(result is None for result in batch_results)
+    assert any(result is not None for result in batch_results)
+
+def test_metrics_frame_matches_scalar():
+    import pandas as pd
+
+    rows = _sample_indicator_rows()
+    df = pd.DataFrame(rows, index=[f"SYM{i}USDT" for i in range(len(rows))])
+    frame = compute_metrics_frame(df)
+
+    assert list(frame.index) == list(df.index)
+    rating_columns = {
+        'bollinger_bands': 'bb_rating', 'stochastic_rsi': 'stoch_rating', 'macd': 'macd_rating',
+        'adx': 'adx_rating', 'cci': 'cci_rating'
+    }
+    for (_, metrics_row), row in zip(frame.iterrows(), rows):
+        metrics = compute_metrics(row)
+        assert bool(metrics_row['valid']) == (metrics is not None)
+        if metrics is None:
+            continue
+        composite = metrics['composite']
+        assert metrics_row['composite_rating'] == composite['rating']
+        assert metrics_row['composite_signal'] == composite['signal']
+        assert round(metrics_row['raw_score'], 2) == composite['breakdown']['raw_score']
+        assert metrics_row['trend_strength'] == composite['trend_strength']
+        for name, column in rating_columns.items():
+            assert metrics_row[column] == metrics['indicators'][name]['rating']
+
+def _sample_trade(symbol, side, entry):
+    """Trade data with a 2% stop and 2%/4% targets"""
+    sign = 1 if side == 'LONG' else -1
+    return {
+        'symbol': symbol,
+        'side': side,
+        'strategy': 'TEST',
+        'entry_price_usd': entry,
+        'entry_price_kes': entry * 129.5,
+        'stop_loss_usd': entry * (1 - sign * 0.02),
+        'stop_loss_kes': entry * (1 - sign * 0.02) * 129.5,
+        'target1_usd': entry * (1 + sign * 0.02),
+        'target1_kes': entry * (1 + sign * 0.02) * 129.5,
+        'target2_usd': entry * (1 + sign * 0.04),
+        'target2_kes': entry * (1 + sign * 0.04) * 129.5
+    }
+
+def _table_rows(db_path, table, skip):
+    """All rows of a table, without the columns in skip"""
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    rows = [{k: row[k] for k in row.keys() if k not in skip}
+            for row in conn.execute(f"SELECT * FROM {table} ORDER BY id")]
+    conn.close()
+    return rows
+
+def _without_exit_time(results):
+    """Check results without the exit_time of closed trades"""
+    return [{k: v for k, v in result.items() if k != 'exit_time'} for result in results]
+
+def test_bulk_checks_match_single_checks():
+    with tempfile.TemporaryDirectory() as tmp:
+        single_path = os.path.join(tmp, 'single.db')
+        db = PaperTradingDB(single_path)
+        trades = [
+            ('BTCUSDT', 'LONG', 100.0, 97.0),    # stop loss
+            ('ETHUSDT', 'LONG', 100.0, 102.5),   # target 1
+            ('SOLUSDT', 'SHORT', 100.0, 95.0),   # target 2
+            ('XRPUSDT', 'SHORT', 100.0, 100.5),  # still open
+            ('ADAUSDT', 'LONG', 100.0, 101.0),   # closed before the check
+        ]
+        checks = [(db.create_trade(_sample_trade(symbol, side, entry)), price, price * 129.5)
+                  for symbol, side, entry, price in trades]
+        db.manually_close_trade(checks[-1][0], 99.0, 99.0 * 129.5, "TEST_CLOSE")
+        checks.append(('MISSING_TRADE', 1.0, 129.5))
+        # Repeated trades must see the effect of their earlier check
+        checks += [(checks[0][0], 90.0, 90.0 * 129.5), (checks[1][0], 103.0, 103.0 * 129.5),
+                   (checks[3][0], 99.0, 99.0 * 129.5)]
+
+        bulk_path = os.path.join(tmp, 'bulk.db')
+        shutil.copy(single_path, bulk_path)
+
+        single_results = [db.update_trade_check(*check) for check in checks]
+        bulk_results = PaperTradingDB(bulk_path).update_trade_checks_bulk(checks)
+
+        # Closed trades come back as full rows, whose exit times differ between the two runs
+        assert _without_exit_time(bulk_results) == _without_exit_time(single_results)
+        assert [r.get('status') for r in bulk_results] == [
+            'STOPPED', 'TP1_HIT', 'TP2_HIT', 'OPEN', 'CLOSED', None, 'CLOSED', 'TP1_HIT', 'OPEN'
+        ]
+        for table, skip in (('paper_trades', {'exit_time'}), ('trade_checks', {'check_time'})):
+            assert _table_rows(bulk_path, table, skip) == _table_rows(single_path, table, skip)
+
+def test_trades_closed_since_cutoff():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'trades.db')
+        db = PaperTradingDB(db_path)
+        exit_times = {
+            'BTCUSDT': '2026-01-01 11:59:59.999000',  # just before the cutoff
+            'ETHUSDT': '2026-01-01 12:00:00',         # exactly at the cutoff
+            'SOLUSDT': '2026-01-01T12:00:00.500',     # 'T' separator, after the cutoff
+            'XRPUSDT': '2026-01-02 08:30:00',
+        }
+        trade_ids = {symbol: db.create_trade(_sample_trade(symbol, 'LONG', 100.0)) for symbol in exit_times}
+        conn = sqlite3.connect(db_path)
+        for symbol, exit_time in exit_times.items():
+            conn.execute("UPDATE paper_trades SET status = 'CLOSED', exit_time = ?, pnl_percent = 1.0, "
+                         "pnl_usd = 10.0 WHERE trade_id = ?", (exit_time, trade_ids[symbol]))
+        conn.commit()
+        conn.close()
+        db.create_trade(_sample_trade('ADAUSDT', 'LONG', 100.0))
+
+        closed = db.get_trades_closed_since('2026-01-01T12:00:00+00:00')
+        assert [t['symbol'] for t in closed] == ['XRPUSDT', 'SOLUSDT', 'ETHUSDT']
+        assert db.get_trades_closed_since('2026-01-03T00:00:00') == []
+
+        snapshot = db.get_daily_review_snapshot('2026-01-01T12:00:00+00:00')
+        assert snapshot['closed'] == closed
+        assert snapshot['open'] == db.get_open_trades()
+        assert snapshot['stats'] == db.get_strategy_stats()
+        assert [t['symbol'] for t in snapshot['open']] == ['ADAUSDT']
+
+def _json_response(status_code, payload):
+    """requests.Response with a JSON body"""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(payload).encode()
+    return response
+
+def test_binance_prices_symbols_filter():
+    import automated_majors_analysis as majors
+
+    tickers = [{'symbol': 'BTCUSDT', 'price': '96500.10'}, {'symbol': 'ETHUSDT', 'price': '3400.5'}]
+    session = MagicMock()
+    session.get.return_value = _json_response(200, tickers)
+    with patch.object(majors, '_SESSION', session):
+        prices = majors.get_binance_prices(['BTCUSDT', 'ETHUSDT'])
+
+    assert prices == {'BTCUSDT': 96500.10, 'ETHUSDT': 3400.5}
+    session.get.assert_called_once()
+    assert session.get.call_args.kwargs['params'] == {'symbols': '["BTCUSDT","ETHUSDT"]'}
+
+def test_binance_prices_fall_back_on_rejected_filter():
+    import automated_majors_analysis as majors
+
+    # Binance answers 400 for the whole filter when any symbol is unknown
+    full_market = [{'symbol': 'BTCUSDT', 'price': '96500.10'}, {'symbol': 'BNBUSDT', 'price': '610.0'},
+                   {'symbol': 'ETHUSDT', 'price': '3400.5'}]
+    session = MagicMock()
+    session.get.side_effect = [_json_response(400, {'code': -1121, 'msg': 'Invalid symbol.'}),
+                               _json_response(200, full_market)]
+    with patch.object(majors, '_SESSION', session):
+        prices = majors.get_binance_prices(['BTCUSDT', 'ETHUSDT', 'GONEUSDT'])
+
+    assert prices == {'BTCUSDT': 96500.10, 'ETHUSDT': 3400.5}
+    assert session.get.call_count == 2
+    assert 'params' in session.get.call_args_list[0].kwargs
+    assert 'params' not in session.get.call_args_list[1].kwargs
+
 if __name__ == "__main__":
     test_paper_trading()
+    test_batch_metrics_match_scalar()
+    test_metrics_frame_matches_scalar()
+    test_bulk_checks_match_single_checks()
+    test_trades_closed_since_cutoff()
+    test_binance_prices_symbols_filter()
+    test_binance_prices_fall_back_on_rejected_filter()
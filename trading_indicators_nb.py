@@ -0,0 +1,180 @@
+"""
+Numba Kernels for Technical Indicator Ratings
+Numeric-only ports of the rating ladders in trading_indicators.py.
+
+These kernels work on plain floats and return integer ratings only, so they
+can be JIT-compiled by numba. Signal strings are resolved by the caller.
+When numba is not installed the kernels run as ordinary Python functions.
+"""
+
+from __future__ import annotations
+
+from trading_constants import (
+    STOCH_OVERSOLD, STOCH_EXTREMELY_OVERSOLD,
+    STOCH_OVERBOUGHT, STOCH_EXTREMELY_OVERBOUGHT, STOCH_MIDPOINT,
+    MACD_HIST_MODERATE, MACD_HIST_STRONG,
+    ADX_WEAK_TREND, ADX_TREND_THRESHOLD, ADX_STRONG_TREND, ADX_VERY_STRONG_TREND,
+    CCI_MILDLY_BEARISH, CCI_OVERBOUGHT, CCI_EXTREMELY_OVERBOUGHT,
+    CCI_MILDLY_BULLISH, CCI_OVERSOLD, CCI_EXTREMELY_OVERSOLD,
+    BB_POSITION_THRESHOLD,
+    RATING_MAX, RATING_MIN,
+)
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def bb_rating_nb(close: float, bb_upper: float, bb_middle: float, bb_lower: float) -> int:
+    """Bollinger Bands rating, see compute_bb_rating_signal."""
+    upper_half_threshold = bb_middle + ((bb_upper - bb_middle) * BB_POSITION_THRESHOLD)
+    lower_half_threshold = bb_middle - ((bb_middle - bb_lower) * BB_POSITION_THRESHOLD)
+
+    if close > bb_upper:
+        return 3
+    if close > upper_half_threshold:
+        return 2
+    if close > bb_middle:
+        return 1
+    if close < bb_lower:
+        return -3
+    if close < lower_half_threshold:
+        return -2
+    if close < bb_middle:
+        return -1
+    return 0
+
+
+@njit(cache=True)
+def stoch_rsi_rating_nb(stoch_k: float, stoch_d: float) -> int:
+    """Stochastic RSI rating, see compute_stoch_rsi_signal."""
+    rating = 0
+    if stoch_k < STOCH_EXTREMELY_OVERSOLD:
+        rating = -3
+    elif stoch_k < STOCH_OVERSOLD:
+        rating = -2
+    elif stoch_k > STOCH_EXTREMELY_OVERBOUGHT:
+        rating = 3
+    elif stoch_k > STOCH_OVERBOUGHT:
+        rating = 2
+
+    if stoch_k > stoch_d and stoch_k < STOCH_MIDPOINT:
+        rating = max(rating - 1, RATING_MIN)
+    elif stoch_k < stoch_d and stoch_k > STOCH_MIDPOINT:
+        rating = min(rating + 1, RATING_MAX)
+    return rating
+
+
+@njit(cache=True)
+def macd_rating_nb(macd: float, macd_signal_line: float, macd_histogram: float) -> int:
+    """MACD rating, see compute_macd_signal."""
+    if macd > macd_signal_line:
+        if macd_histogram > MACD_HIST_STRONG:
+            return -3
+        if macd_histogram > MACD_HIST_MODERATE:
+            return -2
+        return -1
+    if macd < macd_signal_line:
+        if macd_histogram < -MACD_HIST_STRONG:
+            return 3
+        if macd_histogram < -MACD_HIST_MODERATE:
+            return 2
+        return 1
+    return 0
+
+
+@njit(cache=True)
+def adx_trend_strength_nb(adx: float) -> float:
+    """ADX trend strength (0.0 to 1.0), see compute_adx_signal."""
+    if adx > ADX_VERY_STRONG_TREND:
+        return 1.0
+    if adx > ADX_STRONG_TREND:
+        return 0.85
+    if adx > ADX_TREND_THRESHOLD:
+        return 0.7
+    if adx > ADX_WEAK_TREND:
+        return 0.4
+    return 0.2
+
+
+@njit(cache=True)
+def adx_rating_nb(adx: float, plus_di: float, minus_di: float) -> int:
+    """ADX rating, see compute_adx_signal."""
+    if plus_di > minus_di:
+        if adx > ADX_STRONG_TREND:
+            return -3
+        if adx > ADX_TREND_THRESHOLD:
+            return -2
+        return -1
+    if minus_di > plus_di:
+        if adx > ADX_STRONG_TREND:
+            return 3
+        if adx > ADX_TREND_THRESHOLD:
+            return 2
+        return 1
+    return 0
+
+
+@njit(cache=True)
+def cci_rating_nb(cci: float) -> int:
+    """CCI rating, see compute_cci_signal."""
+    if cci > CCI_EXTREMELY_OVERBOUGHT:
+        return 3
+    if cci > CCI_OVERBOUGHT:
+        return 2
+    if cci > CCI_MILDLY_BEARISH:
+        return 1
+    if cci < CCI_EXTREMELY_OVERSOLD:
+        return -3
+    if cci < CCI_OVERSOLD:
+        return -2
+    if cci < CCI_MILDLY_BULLISH:
+        return -1
+    return 0
+
+
+# (bb, stoch, macd, adx, cci ratings, trend_strength, raw_score, composite_rating)
+# from 13 indicator values followed by 5 weights
+SCORE_ROW_SIGNATURE = "Tuple((i8, i8, i8, i8, i8, f8, f8, i8))(" + ", ".join(["f8"] * 18) + ")"
+
+
+# Eager signature: compiled (or loaded from cache) at import, not on the first tick
+@njit(SCORE_ROW_SIGNATURE, cache=True)
+def score_row_nb(
+    close: float, bb_upper: float, bb_middle: float, bb_lower: float,
+    stoch_k: float, stoch_d: float,
+    macd: float, macd_signal_line: float, macd_histogram: float,
+    adx: float, plus_di: float, minus_di: float,
+    cci: float,
+    w_bb: float, w_stoch: float, w_macd: float, w_adx: float, w_cci: float,
+):
+    """
+    Score one symbol across all five indicators.
+
+    Returns:
+        Tuple of (bb_rating, stoch_rating, macd_rating, adx_rating, cci_rating,
+        trend_strength, raw_score, composite_rating)
+    """
+    bb_r = bb_rating_nb(close, bb_upper, bb_middle, bb_lower)
+    stoch_r = stoch_rsi_rating_nb(stoch_k, stoch_d)
+    macd_r = macd_rating_nb(macd, macd_signal_line, macd_histogram)
+    adx_r = adx_rating_nb(adx, plus_di, minus_di)
+    trend_strength = adx_trend_strength_nb(adx)
+    cci_r = cci_rating_nb(cci)
+
+    weighted_sum = bb_r * w_bb + stoch_r * w_stoch + macd_r * w_macd + adx_r * w_adx + cci_r * w_cci
+    total_weight = w_bb + w_stoch + w_macd + w_adx + w_cci
+
+    raw_score = weighted_sum / total_weight if total_weight else 0.0
+    composite_rating = max(RATING_MIN, min(RATING_MAX, round(raw_score)))
+
+    return bb_r, stoch_r, macd_r, adx_r, cci_r, trend_strength, raw_score, composite_rating
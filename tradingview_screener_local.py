@@ -15,6 +15,7 @@ Improvements:
 from __future__ import annotations
 from typing import List, Dict, Any, Optional, Tuple
 import logging
+from operator import itemgetter
 from time import sleep
 
 logger = logging.getLogger(__name__)
@@ -593,6 +594,31 @@ def fetch_screener_multi_changes(
 
 # ==================== INTEGRATION HELPERS ====================
 
+# (trading_metrics key, TradingView key) pairs used by map_to_trading_metrics_format
+_REQUIRED_METRIC_FIELDS = (
+    ('open', 'open'),
+    ('close', 'close'),
+    ('SMA20', 'SMA20'),
+    ('BB.upper', 'BB.upper'),
+    ('BB.lower', 'BB.lower'),
+)
+# Extended indicators (verify column names); missing ones map to None
+_EXTENDED_METRIC_FIELDS = (
+    ('StochRSI.K', 'Stoch.RSI.K'),
+    ('StochRSI.D', 'Stoch.RSI.D'),
+    ('MACD', 'MACD.macd'),
+    ('MACD.signal', 'MACD.signal'),
+    ('MACD.histogram', 'MACD.hist'),
+    ('ADX', 'ADX'),
+    ('ADX.plus_di', 'ADX.plus'),
+    ('ADX.minus_di', 'ADX.minus'),
+    ('CCI', 'CCI20'),
+)
+_METRIC_KEYS = tuple(dst for dst, _ in _REQUIRED_METRIC_FIELDS + _EXTENDED_METRIC_FIELDS)
+_get_required_fields = itemgetter(*(src for _, src in _REQUIRED_METRIC_FIELDS))
+_EXTENDED_SOURCE_KEYS = tuple(src for _, src in _EXTENDED_METRIC_FIELDS)
+
+
 def map_to_trading_metrics_format(indicators: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Map TradingView indicators to trading_metrics.py format.
@@ -607,32 +633,18 @@ def map_to_trading_metrics_format(indicators: Dict[str, Any]) -> Optional[Dict[s
         Formatted indicators for compute_metrics() or None if incomplete
     """
     try:
-        # Map to expected format
-        formatted = {
-            'open': indicators['open'],
-            'close': indicators['close'],
-            'SMA20': indicators['SMA20'],
-            'BB.upper': indicators['BB.upper'],
-            'BB.lower': indicators['BB.lower'],
-            # Extended indicators (verify column names)
-            'StochRSI.K': indicators.get('Stoch.RSI.K'),
-            'StochRSI.D': indicators.get('Stoch.RSI.D'),
-            'MACD': indicators.get('MACD.macd'),
-            'MACD.signal': indicators.get('MACD.signal'),
-            'MACD.histogram': indicators.get('MACD.hist'),
-            'ADX': indicators.get('ADX'),
-            'ADX.plus_di': indicators.get('ADX.plus'),
-            'ADX.minus_di': indicators.get('ADX.minus'),
-            'CCI': indicators.get('CCI20'),
-        }
-        
-        # Check if all required fields are present
-        required = ['open', 'close', 'SMA20', 'BB.upper', 'BB.lower']
-        if any(formatted[k] is None for k in required):
+        # Required fields in one itemgetter call (KeyError if absent)
+        required = _get_required_fields(indicators)
+        if any(v is None for v in required):
             return None
         
-        return formatted
+        get = indicators.get
+        values = required + tuple(get(src) for src in _EXTENDED_SOURCE_KEYS)
+        
+        # Cast to native floats once so downstream consumers (JSON reports,
+        # numpy batch scoring) can use the values as-is
+        return {k: None if v is None else float(v) for k, v in zip(_METRIC_KEYS, values)}
         
-    except (KeyError, TypeError) as e:
+    except (KeyError, TypeError, ValueError) as e:
         logger.error(f"Error mapping indicators: {e}")
         return None